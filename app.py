@@ -1,15 +1,24 @@
 ﻿import streamlit as st
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
-import folium
-from streamlit_folium import st_folium
-import requests
+from markdown_it import MarkdownIt
+import functools
+import html as _html
+import io
+import math
+import re
+import threading
+import time
+from PIL import Image, ImageDraw
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from models.flood_predictor import FloodPredictor, clean_value, get_bangkok_time
+from models.flood_predictor import FloodPredictor, clean_value, get_bangkok_time, BANGKOK_TZ
 from models.ingest import read_provenance
 from models.qa import compute_qa_flags, qa_badge
 from constants import EMERGENCY_CONTACTS, EVACUATION_ZONES, STATION_METADATA
 from hatyai_scraper import scrape_hatyai_climate, check_zombie_data
-from utils import fmt, dot, icon_b64, CRITICAL_LEVEL, WARNING_LEVEL
+from utils import fmt, dot, icon_b64, lttb_indices, load_json, shared_cached, HTTP_SESSION, CRITICAL_LEVEL, WARNING_LEVEL
 from ui.components import render_sidebar, render_action_banner, render_qa_strip, render_zombie_warning
 from ui import render_hero, render_pipeline, render_footer, render_inline_qa_badges
 
@@ -28,21 +37,24 @@ st.set_page_config(
 # =============================================================
 import json as _json
 import os as _os
+from types import MappingProxyType as _frozen
 
 _LOCALE_DIR = _os.path.join(_os.path.dirname(__file__), "locales")
 
-@st.cache_data
+# cache_resource hands back the same object every rerun (cache_data would
+# unpickle a fresh copy each time); read-only views keep it safe to share.
+@st.cache_resource
 def _load_translations():
     out = {}
     for code, filename in [("EN", "en.json"), ("TH", "th.json")]:
         path = _os.path.join(_LOCALE_DIR, filename)
         try:
             with open(path, "r", encoding="utf-8") as f:
-                out[code] = _json.load(f)
+                out[code] = _frozen(_json.load(f))
         except Exception as e:
             st.error(f"Locale load error ({filename}): {e}")
-            out[code] = {}
-    return out
+            out[code] = _frozen({})
+    return _frozen(out)
 
 TRANSLATIONS = _load_translations()
 
@@ -58,14 +70,6 @@ def _css_hash():
     except Exception:
         return "0"
 
-@st.cache_data
-def _load_css(_hash):
-    try:
-        with open(_CSS_PATH, "r", encoding="utf-8") as f:
-            return f"<style>{f.read()}</style>"
-    except Exception:
-        return ""
-
 _font_fix = """
 <style>
 @import url('https://fonts.googleapis.com/icon?family=Material+Icons|Material+Icons+Outlined|Material+Icons+Round|Material+Icons+Sharp|Material+Icons+Two+Tone');
@@ -79,294 +83,527 @@ _font_fix = """
 }
 </style>
 """
-st.markdown(_load_css(_css_hash()) + _font_fix, unsafe_allow_html=True)
+
+# Shared str, one entry per stylesheet mtime. The argument must not be
+# underscore-prefixed: Streamlit skips hashing those, which would pin the
+# first revision for the life of the process.
+@st.cache_resource(max_entries=2)
+def _load_css(css_mtime):
+    """Full style block (stylesheet + icon font fix), built once per CSS revision."""
+    try:
+        with open(_CSS_PATH, "r", encoding="utf-8") as f:
+            return f"<style>{f.read()}</style>" + _font_fix
+    except Exception:
+        return _font_fix
+
+st.markdown(_load_css(_css_hash()), unsafe_allow_html=True)
 
 # =============================================================
 # 4. INITIALIZATION
 # =============================================================
-# Removed cache_resource to ensure latest code is used
-# @st.cache_resource
-def get_predictor():
+# Version key: bump HYFI_VERSION on deploy to force a fresh FloodPredictor.
+# Without it, the predictor module's mtime stands in, so editing the model
+# code locally also drops the shared instance instead of serving a stale one.
+import sys as _sys
+PREDICTOR_VERSION = _os.environ.get("HYFI_VERSION") or (
+    "dev-%d" % _os.path.getmtime(_sys.modules[FloodPredictor.__module__].__file__)
+)
+
+@st.cache_resource
+def get_predictor(version):
     return FloodPredictor()
 
-predictor = get_predictor()
+predictor = get_predictor(PREDICTOR_VERSION)
 
-@st.dialog("ℹ️ เกี่ยวกับระบบนี้ (About HYFI Intelligence)")
-def show_about_dialog(lang_key):
-    # Depending on language, show either Thai or English. The user provided exhaustive Thai docs.
-    if lang_key == 'th':
-        st.markdown("""
-**ยินดีต้อนรับสู่ HYFI Intelligence ระบบวิเคราะห์ความเสี่ยงน้ำท่วมอัจฉริยะสำหรับพื้นที่หาดใหญ่**
-
-**📡 1. ระบบนี้ทำงานอย่างไร?**
-ระบบของเราประเมินความเสี่ยงโดยผสานข้อมูลหลายแหล่งเข้าด้วยกัน (Hybrid Intelligence) เพื่อความแม่นยำสูงสุด:
-- **ข้อมูลจริงจากพื้นที่:** ดึงข้อมูลระดับน้ำแบบเรียลไทม์จากสถานีวัดน้ำ (X.44, X.90, X.173)
-- **ข้อมูลพยากรณ์ล่วงหน้า:** คาดการณ์ปริมาณฝนสะสมล่วงหน้า 3 วัน โดยอ้างอิงจาก Open-Meteo API
-- **ระบบสำรองอัตโนมัติ (Virtual Mode):** หากเซนเซอร์วัดระดับน้ำในพื้นที่ขัดข้อง ระบบจะสลับไปใช้ข้อมูลปริมาณฝนเพื่อประเมินความเสี่ยงแทนทันที
-- **การประเมินทิศทางน้ำ:** มีการคำนวณความเร็วกระแสน้ำและลักษณะความคดเคี้ยวของคลองอู่ตะเภา เพื่อกะเวลาที่มวลน้ำจะเดินทางมาถึง (ETA) ได้อย่างใกล้เคียงความเป็นจริง
-
-**📍 2. สถานีเฝ้าระวังหลัก**
-- **ต้นน้ำ (อ.สะเดา):** สถานี X.173 - ด่านหน้าคอยรับมวลน้ำจากทางทิศใต้
-- **กลางน้ำ (บ้านบางศาลา):** สถานี X.90 - จุดยุทธศาสตร์สำคัญในการเตือนภัยก่อนมวลน้ำเข้าสู่ตัวเมือง
-- **ปลายน้ำ (เทศบาลนครหาดใหญ่):** สถานี X.44 - เขตพื้นที่เศรษฐกิจและใจกลางเมือง
-
-**🚦 3. การอ่านค่าหน้าปัดความเสี่ยง**
-- 🟢 **0-30% (ปกติ):** สถานการณ์ปลอดภัย การระบายน้ำทำได้ดี
-- 🟡 **31-70% (เฝ้าระวัง):** ฝนเริ่มตกสะสม ควรเริ่มติดตามข่าวสารอย่างใกล้ชิด
-- 🔴 **71-100% (วิกฤต):** เสี่ยงน้ำท่วมสูง ควรเตรียมพร้อมรับมือหรือพิจารณาอพยพ
-
-**🚰 4. เกณฑ์ระดับน้ำ (สำหรับเฝ้าระวัง)**
-- 🟢 **ปกติ:** ต่ำกว่า 5.90 ม. รทก.
-- ⚠️ **เฝ้าระวัง:** 5.90 – 7.40 ม. รทก. (น้ำเริ่มใกล้ตลิ่ง)
-- 🚨 **วิกฤต:** ตั้งแต่ 7.40 ม. รทก. ขึ้นไป (น้ำล้นตลิ่ง)
-
-**✅ 5. ข้อแนะนำในการเตรียมรับมือ**
-- **สถานะสีเขียว:** ติดตามพยากรณ์อากาศและตรวจสอบไม่ให้มีขยะอุดตันท่อระบายน้ำรอบบ้าน
-- **สถานะสีเหลือง:** ขนย้ายสิ่งของขึ้นที่สูง เตรียมแบตเตอรี่สำรอง ไฟฉาย และเช็กสภาพรถยนต์
-- **สถานะสีแดง:** นำรถไปจอดในพื้นที่สูง (เช่น ตึกฟักทอง ม.อ.) สับคัตเอาต์ตัดไฟชั้นล่าง และเตรียมตัวอพยพ
-
-**🆘 6. ฟีเจอร์ช่วยเหลือยามฉุกเฉิน**
-- **โหมดวิกฤต (Critical Mode):** ระบบจะแสดงเบอร์โทรติดต่อฉุกเฉินของหน่วยงานในหาดใหญ่ พร้อมแนะนำเส้นทางอพยพโดยอัตโนมัติ
-- **กะเวลาน้ำมาถึง (Real-time ETA):** ช่วยประเมินระยะเวลาที่มวลน้ำจะเดินทางมาถึงพื้นที่เป้าหมาย
-- **เทียบสถิติในอดีต:** นำสถานการณ์ปัจจุบันไปเทียบกับข้อมูลเหตุการณ์น้ำท่วมใหญ่ (เช่น ปี 2553) เพื่อให้เห็นภาพความรุนแรงได้ชัดเจนขึ้น
-
-⚠️ **หมายเหตุ:** ข้อมูลในระบบนี้มาจากการวิเคราะห์ทางสถิติและแบบจำลองทางอุทกวิทยา โปรดใช้เพื่อประกอบการตัดสินใจควบคู่กับการติดตามประกาศเตือนภัยจากหน่วยงานราชการ
-
-💻 *พัฒนาโดย Mongkhonphat*
-        """)
-    else:
-        # Fallback to English using the existing dictionary or a simplified version
-        st.markdown("""
-**Welcome to HYFI Intelligence — Intelligent Flood Risk Analysis System for Hatyai**
+# Upper bound on points per chart trace; longer series are LTTB-downsampled
+MAX_CHART_POINTS = 200
 
-**📡 1. How does it work?**
-Our system uses Hybrid Intelligence to evaluate risks:
-- Live Local Sensors (X.44, X.90, X.173)
-- 3-day Rainfall Forecasts (Open-Meteo)
-- Virtual Flow modeling if sensors fail.
+# --- CACHE STATS (process-wide, shown under Settings → cache stats) ---
+# Held in cache_resource rather than session_state: the fetches run on worker
+# threads, and this script body re-executes on every rerun. Counters are as of
+# the previous rerun when the sidebar draws them. The lock is process-wide too,
+# since _fetch_all bumps counters from its thread pool.
+@st.cache_resource
+def _cache_stats_store():
+    return {}, threading.Lock()
 
-**📍 2. Monitoring Stations**
-- Upstream: Sadao (X.173)
-- Midstream: Bang Sala (X.90)
-- Downstream: Hatyai City (X.44)
+CACHE_STATS, _CACHE_STATS_LOCK = _cache_stats_store()
 
-**🚦 3. Interpreting the Gauge**
-- 🟢 0-30% (Normal): Safe operations.
-- 🟡 31-70% (Watch): Rising water, stay alert.
-- 🔴 71-100% (Critical): High risk, consider evacuation.
+def _tracked_cache(name, shared_ttl=None, should_store=None, **cache_kwargs):
+    """
+    st.cache_data that also records calls / memory misses / misses (body actually
+    ran) / last call ms. With `shared_ttl`, the disk-backed shared_cached layer sits
+    between the two, so memory misses - misses = disk hits.
+    """
+    stats = CACHE_STATS.setdefault(name, {"calls": 0, "mem_misses": 0, "misses": 0, "last_ms": 0.0})
+    def bump(key):
+        with _CACHE_STATS_LOCK:
+            stats[key] += 1
+    def deco(fn):
+        @functools.wraps(fn)
+        def body(*args, **kwargs):
+            bump("misses")
+            return fn(*args, **kwargs)
+        inner = shared_cached(shared_ttl, should_store)(body) if shared_ttl else body
+        @functools.wraps(fn)
+        def on_miss(*args, **kwargs):
+            bump("mem_misses")
+            return inner(*args, **kwargs)
+        cached = st.cache_data(**cache_kwargs)(on_miss)
+        @functools.wraps(fn)
+        def call(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - t0) * 1000
+                with _CACHE_STATS_LOCK:
+                    stats["calls"] += 1
+                    stats["last_ms"] = elapsed
+        call.clear = cached.clear
+        return call
+    return deco
 
-**🚰 4. Water Thresholds (Station X.44)**
-- 🟢 Normal: < 5.90 m MSL
-- ⚠️ Watch: 5.90 – 7.40 m MSL
-- 🚨 Critical: ≥ 7.40 m MSL
+# --- DATA FETCH (shared across sessions; TTL matches each source's update cadence) ---
+# Two levels: st.cache_data in this process, then shared_cached on disk (shared_ttl) so a
+# restarted or sibling worker reuses the last fetch instead of going to the
+# network. Worst-case age of a served value is therefore 2x the TTL.
+# Failed fetches (fallback / error / None payloads) are not written to disk.
+SENSOR_TTL = 300   # ThaiWater telemetry refreshes every ~15 min
+RAIN_TTL = 900     # Open-Meteo forecast changes hourly at most
 
-⚠️ **Note:** Driven by statistical modeling and hydraulics. Follow official announcements.
+@_tracked_cache("sensor", shared_ttl=SENSOR_TTL, should_store=lambda d: not d.get("is_fallback"),
+                ttl=SENSOR_TTL, max_entries=16, show_spinner=False)
+def _fetch_sensor():
+    return predictor.fetch_and_store_data()
 
-💻 *Developed by Mongkhonphat*
-        """)
+@_tracked_cache("rain", shared_ttl=RAIN_TTL, should_store=lambda d: not d.get("error"),
+                ttl=RAIN_TTL, max_entries=16, show_spinner=False)
+def _fetch_rain(lat, lon):
+    return predictor.fetch_rain_forecast(lat, lon)
 
-# =============================================================
-# 5. MAIN APP
-# =============================================================
-def main():
-    if 'lang' not in st.session_state:
-        st.session_state.lang = "TH"
-    
-    lang_key = st.session_state.lang.lower()
+RAIN_COORDS = (STATION_METADATA['HatYai']['lat'], STATION_METADATA['HatYai']['lon'])
 
-    # --- SIDEBAR ---
-    # T update handled by state change, main rerun picks it up at top
-    t = TRANSLATIONS[st.session_state.lang]
-    render_sidebar(t, predictor)
+@_tracked_cache("local_intel", shared_ttl=600, should_store=lambda r: r.get("success"),
+                ttl=600, max_entries=1, show_spinner=False)
+def _fetch_local_intel():
+    return scrape_hatyai_climate()
 
-    # --- DATA FETCH (cached 10 min to avoid redundant API calls) ---
-    @st.cache_data(ttl=600, show_spinner=False)
-    def _fetch_sensor():
-        return predictor.fetch_and_store_data()
-    
-    @st.cache_data(ttl=600, show_spinner=False)
-    def _fetch_rain():
-        return predictor.fetch_rain_forecast()
-    
-    with st.spinner("กำลังโหลดข้อมูล..." if st.session_state.lang == "TH" else "Loading data..."):
-        sensor_data = _fetch_sensor()
-        rain_data = _fetch_rain()
-    
-    # --- HYBRID INTELLIGENCE: Zombie Data Detection ---
-    @st.cache_data(ttl=600, show_spinner=False)
-    def _fetch_local_intel():
-        return scrape_hatyai_climate()
-    
-    local_intel = _fetch_local_intel()
-    zombie_report = {}
-    
-    if local_intel.get('success') and local_intel.get('outage_stations'):
-        sensor_data, zombie_report = check_zombie_data(sensor_data, local_intel)
-    
-    # === FAILSAFE: Detect total data loss ===
-    _no_sensor = sensor_data.get('level') is None and not sensor_data.get('all_data')
-    _no_rain = rain_data.get('rain_sum_3d', 0) == 0 and not rain_data.get('raw_daily')
-    if _no_sensor and _no_rain:
-        st.error(
-            "🚫 **" + ("ไม่สามารถเชื่อมต่อแหล่งข้อมูลใดได้" if st.session_state.lang == 'TH'
-            else "All data sources unavailable") + "**\n\n" +
-            ("ระบบไม่สามารถแสดงความเสี่ยงที่แม่นยำได้ กรุณาตรวจสอบประกาศจากเทศบาลนครหาดใหญ่โดยตรง"
-            if st.session_state.lang == 'TH'
-            else "System cannot display accurate risk. Please check Hatyai Municipality announcements directly.")
+@_tracked_cache("radar", shared_ttl=600, should_store=lambda d: d is not None,
+                ttl=600, max_entries=1, show_spinner=False)
+def _fetch_rainviewer():
+    try:
+        resp = HTTP_SESSION.get("https://api.rainviewer.com/public/weather-maps.json", timeout=5)
+        if resp.status_code == 200:
+            return load_json(resp)
+    except Exception:
+        pass
+    return None
+
+# --- DERIVED ANALYTICS (cached per input fingerprint, so widget reruns skip recompute) ---
+def _sensor_sig(sensor_data):
+    """Cheap hashable surrogate for sensor_data: changes whenever a new reading lands."""
+    ts = sensor_data.get("timestamp")
+    return (
+        ts.isoformat() if ts else None,
+        sensor_data.get("level"),
+        sensor_data.get("station_name"),
+        tuple(sorted(sensor_data.get("all_data", {}).items())),
+    )
+
+def _rain_sig(rain_data):
+    return (rain_data.get("rain_sum_3d"), tuple(rain_data.get("raw_daily", [])))
+
+@_tracked_cache("station_series", ttl=SENSOR_TTL, max_entries=16, show_spinner=False)
+def _station_series(hours, sensor_sig):
+    return predictor.get_station_series(hours=hours)
+
+@_tracked_cache("rate_of_change", ttl=SENSOR_TTL, max_entries=16, show_spinner=False)
+def _rate_of_change(sensor_sig):
+    return predictor.calculate_rate_of_change()
+
+@_tracked_cache("predict", ttl=SENSOR_TTL, max_entries=16, show_spinner=False)
+def _predict(hours, sensor_sig):
+    return predictor.predict_next_hours(hours)
+
+@_tracked_cache("analyze", ttl=SENSOR_TTL, max_entries=16, show_spinner=False)
+def _analyze(sensor_sig, rain_sig, _sensor_data, _rain_data, _roc):
+    return predictor.analyze_flood_risk(_sensor_data, _rain_data, _roc)
+
+def _fetch_all():
+    """
+    The four fetches are independent I/O — overlap them (wall time = max, not sum).
+    RainViewer is only warmed here; the radar fragment reads it from the cache.
+    """
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        sensor_future = ex.submit(_fetch_sensor)
+        rain_future = ex.submit(_fetch_rain, *RAIN_COORDS)
+        intel_future = ex.submit(_fetch_local_intel)
+        ex.submit(_fetch_rainviewer)
+        return sensor_future.result(), rain_future.result(), intel_future.result()
+
+def _downsample(df, col='level'):
+    if len(df) <= MAX_CHART_POINTS:
+        return df
+    return df.iloc[lttb_indices(df[col].to_numpy(), MAX_CHART_POINTS)]
+
+# --- CHART BUILDERS (pure: same inputs -> same figure, so build once and share) ---
+# Held as go.Figure in cache_resource, not as a dict in cache_data: st.plotly_chart
+# re-validates a plain dict through Figure(**d) on every call (~4x the cost of
+# handing it a Figure). Shared across sessions, so treat the result as read-only.
+# Hourly rain buckets: <=2 light, <=10 moderate, <=30 heavy, >30 severe (mm/hr)
+_RAIN_THRESHOLDS = np.array([2, 10, 30])
+_RAIN_PALETTE = np.array(["#93c5fd", "#3b82f6", "#eab308", "#ef4444"])
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _daily_fig(vals, labels):
+    fig = go.Figure(data=[
+        go.Bar(
+            x=list(labels), y=list(vals),
+            marker_color=['#3b82f6', '#2563EB', '#1d4ed8'],
+            text=[f"{v:.1f}" for v in vals],
+            textposition='auto',
+            textfont=dict(color='white', size=13)
         )
+    ])
+    fig.update_layout(
+        height=160, margin=dict(l=0,r=0,t=5,b=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='#e2e8f0', title="mm")
+    )
+    return fig
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _rain_fig(times, rain):
+    arr = np.asarray(rain, dtype=float)
+    # side='left' counts thresholds strictly below v, i.e. the old `v > t` tests
+    colors = _RAIN_PALETTE[np.searchsorted(_RAIN_THRESHOLDS, arr, side='left')].tolist()
+    labels = np.where(arr > 0.5, np.char.mod("%.1f", arr), "").tolist()
     
-    risk_report = predictor.analyze_flood_risk(sensor_data, rain_data)
+    fig = go.Figure(go.Bar(
+        x=list(times), y=list(rain),
+        marker_color=colors,
+        text=labels,
+        textposition='outside', textfont=dict(size=9, color='#64748b')
+    ))
     
-    latest_df = predictor.get_latest_data(hours=24)
-    roc = predictor.calculate_rate_of_change()
-    preds = predictor.predict_next_hours(3)
+    # Thresholds
+    fig.add_hline(y=10, line_dash="dot", line_color="#cbd5e1")
     
-    # QA/QC flags
-    qa_result = compute_qa_flags(sensor_data, roc, sensor_data.get('timestamp'))
+    fig.update_layout(
+        height=280, margin=dict(l=20,r=20,t=10,b=30),
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        # Fixed Date format to prevent overlap (HH:MM)
+        xaxis=dict(showgrid=False, tickformat="%H:%M", tickangle=-45, dtick=10800000), # 3 hours
+        yaxis=dict(showgrid=True, gridcolor='#e2e8f0', title="mm/hr"),
+        showlegend=False
+    )
+    return fig
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _water_fig(hatyai_plot, sadao_plot):
+    fig = go.Figure()
+
+    # Danger zones
+    fig.add_hrect(y0=CRITICAL_LEVEL, y1=20, fillcolor="rgba(239,68,68,0.05)", line_width=0)
+    fig.add_hrect(y0=WARNING_LEVEL, y1=CRITICAL_LEVEL, fillcolor="rgba(234,179,8,0.05)", line_width=0)
+
+    # Force modes line+markers for visibility (WebGL traces render faster than SVG)
+    # Levels ship as float32 (Plotly encodes ndarrays as typed-array base64: half
+    # the bytes of float64, still mm-exact); hover is rounded to cm to match
+    fig.add_trace(go.Scattergl(
+        x=hatyai_plot['timestamp'], y=hatyai_plot['level'].to_numpy(dtype=np.float32),
+        yhoverformat='.2f',
+        name='Hat Yai', mode='lines+markers',
+        line=dict(color='#2563EB', width=3),
+        marker=dict(size=6),
+        fill='tozeroy', fillcolor='rgba(37,99,235,0.05)'
+    ))
+    fig.add_trace(go.Scattergl(
+        x=sadao_plot['timestamp'], y=sadao_plot['level'].to_numpy(dtype=np.float32),
+        yhoverformat='.2f',
+        name='Sadao', mode='lines+markers',
+        line=dict(color='#06b6d4', width=2, dash='dot'),
+        marker=dict(size=5)
+    ))
     
-    # Timezone handling with proper Bangkok time
-    last_update = sensor_data.get("timestamp") or get_bangkok_time()
-    last_update_str = last_update.strftime('%d/%m/%Y %H:%M')
+    # Forecast line removed as requested
 
-    # === HEADER — Centered Title (matching user's mockup) ===
-    source_display = risk_report['data_source']
-    _logo = icon_b64('logo.png')
-    # Logo size 2.5x via CSS class
-    _logo_img = f'<img src="{_logo}" class="hero-logo-massive">' if _logo else ''
-    _header_html = (
-        '<div style="position:relative;text-align:center;margin-bottom:20px;padding-bottom:12px;border-bottom:4px solid #60a5fa;">'
-        '<div style="position:absolute;top:0;right:0;text-align:right;font-size:0.82rem;color:#64748b;line-height:1.7;">'
-        f'<span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:#22c55e;margin-right:5px;animation:pulse-dot 2s ease-in-out infinite;"></span> <b style="color:#1a1a2e;">LIVE</b><br>'
-        f'{t["last_update"]}: <b style="color:#1a1a2e;">{last_update_str}</b><br>'
-        f'{t["source"]}: {source_display}'
-        '</div>'
-        '<div style="display:inline-flex;align-items:center;gap:30px;justify-content:center;">'
-        f'{_logo_img}'
-        '<div style="text-align:left;">'
-        # Title 2.5x larger (104px), Subtitle 2x larger (35px) via CSS classes
-        f'<div class="hero-title-massive">{t["title"]}</div>'
-        f'<div class="hero-subtitle-massive">{t["subtitle"]}</div>'
-        '</div></div></div>'
+    # Threshold lines
+    fig.add_hline(y=WARNING_LEVEL, line_dash="solid", line_color="#eab308", line_width=1,
+                  annotation_text="Warning", annotation_font_color="#a16207")
+    fig.add_hline(y=CRITICAL_LEVEL, line_dash="solid", line_color="#ef4444", line_width=1,
+                  annotation_text="Critical", annotation_font_color="#dc2626")
+    
+    fig.update_layout(
+        height=350, margin=dict(l=0,r=0,t=10,b=0),
+        paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+        hovermode="x unified",
+        xaxis=dict(showgrid=False, tickformat="%H:%M\n%d/%m"),
+        yaxis=dict(showgrid=True, gridcolor='#e2e8f0'),
+        legend=dict(orientation="h", y=1.08, font=dict(color='#1e293b'))
     )
-    st.markdown(_header_html, unsafe_allow_html=True)
+    return fig
 
-    # === ABOUT MODAL MENU BUTTON ===
-    bt1, bt2, bt3 = st.columns([1, 2, 1])
-    with bt2:
-        btn_label = "ℹ️ เกี่ยวกับระบบนี้" if lang_key == 'th' else "ℹ️ About This System"
-        if st.button(btn_label, use_container_width=True):
-            show_about_dialog(lang_key)
+_ABOUT_HEADING = re.compile(r"^\*\*(\S+ \d+\. .+)\*\*$")
 
+def _about_html(md):
+    """
+    Render an About body to one HTML document, split on its blank lines.
+    A paragraph led by a numbered '**📡 1. ...**' heading becomes a native
+    <details> section (only the first starts open); anything else (welcome
+    line, note, credit) is emitted as-is. Rendered here once, so opening the
+    dialog skips the client-side markdown pipeline and mounts one element
+    (raw HTML disabled — the source is plain markdown).
+    """
+    renderer = MarkdownIt("commonmark", {"html": False})
+    parts = ['<div class="about-body">']
+    first = True
+    for para in md.strip().split("\n\n"):
+        head, _, body = para.partition("\n")
+        m = _ABOUT_HEADING.match(head)
+        if m:
+            parts.append(
+                f'<details{" open" if first else ""}><summary>{_html.escape(m.group(1))}</summary>'
+                f'{renderer.render(body)}</details>'
+            )
+            first = False
+        else:
+            parts.append(renderer.render(para))
+    parts.append('</div>')
+    return "".join(parts)
 
-    # === DISCLAIMER — right under title ===
-    _disc = t.get('disclaimer', '')
-    if _disc:
-        st.markdown(
-            f'<div style="background:#fefce8;border:1px solid #fde047;border-radius:10px;padding:12px 18px;margin-bottom:16px;font-size:0.82rem;color:#854d0e;line-height:1.7;">{_disc}</div>',
-            unsafe_allow_html=True
-        )
+# app.py re-executes top to bottom on every rerun, so "once at import" has
+# to be a cache_resource: read, split + render the About bodies once per process
+@st.cache_resource
+def _about_content():
+    out = {}
+    for code in ("th", "en"):
+        path = _os.path.join(_LOCALE_DIR, f"about_{code}.md")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                out[code] = _about_html(f.read())
+        except Exception as e:
+            st.error(f"About text load error (about_{code}.md): {e}")
+            out[code] = ""
+    return out
 
-    if sensor_data['is_fallback']:
-        st.warning(f"⚠️ Sensor data unavailable. Using **{source_display}** ({risk_report['confidence_score']}%)")
-    
-    # --- QA STATUS STRIP ---
-    render_qa_strip(qa_result, lang_key)
+_ABOUT_HTML = _about_content()
+
+@st.dialog("ℹ️ เกี่ยวกับระบบนี้ (About HYFI Intelligence)")
+def show_about_dialog():
+    lang_key = st.session_state.get("lang", "EN").lower()
+    st.html(_ABOUT_HTML.get(lang_key, _ABOUT_HTML["en"]))
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _radar_frames(generated, _rv_data):
+    """
+    Slider options for one RainViewer payload, keyed by its 'generated' stamp:
+    ({"HH:MM" Bangkok time: frame path}, default label).
+    """
+    # Combine past and nowcast frames
+    past = _rv_data['radar'].get('past', [])
+    frames = past + _rv_data['radar'].get('nowcast', [])
+    frame_paths = {
+        datetime.fromtimestamp(f['time'], tz=BANGKOK_TZ).strftime("%H:%M"): f['path']
+        for f in frames
+    }
+    labels = list(frame_paths)
     
-    # QA badges inline (compact)
-    render_inline_qa_badges(qa_result)
+    # Default to the 'now' frame or the last past frame
+    default_idx = len(past) - 1
+    if default_idx < 0: default_idx = len(labels) - 1
+    return frame_paths, (labels[default_idx] if labels else None)
 
-    # --- ACTION BANNER (always visible, risk-appropriate) ---
-    risk_pct = risk_report.get('primary_risk', 0)
+# --- RADAR IMAGE (server-side composite: basemap + RainViewer frame, one PNG per frame) ---
+# A 3x3 block of 256px slippy-map tiles around Songkhla at zoom 8 (~4 degrees square)
+RADAR_CENTER = (7.0048, 100.4730)
+RADAR_ZOOM = 8
+_RADAR_GRID = 3
+_BASEMAP_URL = "https://basemaps.cartocdn.com/light_all/{z}/{x}/{y}.png"
+_RADAR_TILE_URL = "https://tilecache.rainviewer.com{path}/256/{z}/{x}/{y}/2/1_1.png"
 
-    # --- ZOMBIE DATA WARNING ---
-    render_zombie_warning(zombie_report, lang_key)
+def _tile_xy(lat, lon, z):
+    """Fractional slippy-map tile coordinates (Web Mercator)."""
+    n = 2 ** z
+    lat_r = math.radians(lat)
+    return (lon + 180.0) / 360.0 * n, (1.0 - math.asinh(math.tan(lat_r)) / math.pi) / 2.0 * n
 
-    # ==========================================================
-    # SECTION 1: HERO — Risk Gauge + ETA + Situation Report
-    # ==========================================================
-    render_hero(risk_report, lang_key, t)
+_cx, _cy = _tile_xy(*RADAR_CENTER, RADAR_ZOOM)
+_RADAR_ORIGIN = (int(_cx) - _RADAR_GRID // 2, int(_cy) - _RADAR_GRID // 2)
+_RADAR_MARKER = ((_cx - _RADAR_ORIGIN[0]) * 256, (_cy - _RADAR_ORIGIN[1]) * 256)
+_RADAR_TILES = tuple(
+    (col, row, _RADAR_ORIGIN[0] + col, _RADAR_ORIGIN[1] + row)
+    for row in range(_RADAR_GRID) for col in range(_RADAR_GRID)
+)
 
-    # ==========================================================
-    # EMERGENCY RESPONSE SECTION (Critical Mode)
-    # ==========================================================
+def _get_tile(url):
+    try:
+        resp = HTTP_SESSION.get(url, timeout=5)
+        if resp.status_code == 200:
+            return Image.open(io.BytesIO(resp.content)).convert("RGBA")
+    except Exception:
+        pass
+    return None
+
+def _mosaic(url_template, **fmt_kwargs):
+    """
+    Fetch the tile block concurrently and paste it into one RGBA canvas.
+    Returns (canvas, complete); missing tiles stay transparent.
+    """
+    canvas = Image.new("RGBA", (256 * _RADAR_GRID, 256 * _RADAR_GRID), (0, 0, 0, 0))
+    urls = [url_template.format(z=RADAR_ZOOM, x=x, y=y, **fmt_kwargs) for _, _, x, y in _RADAR_TILES]
+    complete = True
+    with ThreadPoolExecutor(max_workers=_RADAR_GRID ** 2) as ex:
+        for (col, row, _, _), tile in zip(_RADAR_TILES, ex.map(_get_tile, urls)):
+            if tile is None:
+                complete = False
+            else:
+                canvas.paste(tile, (col * 256, row * 256))
+    return canvas, complete
+
+@st.cache_resource
+def _basemap():
+    """Basemap never changes for a fixed view — fetched once per process (retried while incomplete)."""
+    base = Image.new("RGBA", (256 * _RADAR_GRID, 256 * _RADAR_GRID), (241, 245, 249, 255))
+    tiles, complete = _mosaic(_BASEMAP_URL)
+    base.alpha_composite(tiles)
+    return base, complete
+
+@st.cache_data(ttl=600, max_entries=32, show_spinner=False)
+def _radar_png(path):
+    """PNG bytes for one RainViewer frame over the basemap, with a Hat Yai marker."""
+    radar, _ = _mosaic(_RADAR_TILE_URL, path=path)
+    # 70% opacity overlay, as the old Leaflet layer had
+    radar.putalpha(radar.getchannel("A").point(lambda a: a * 7 // 10))
+    base, complete = _basemap()
+    if not complete:
+        _basemap.clear()
+    img = base.copy()
+    img.alpha_composite(radar)
+    mx, my = _RADAR_MARKER
+    ImageDraw.Draw(img).ellipse((mx - 6, my - 6, mx + 6, my + 6), fill="#dc2626", outline="white", width=2)
+    buf = io.BytesIO()
+    img.convert("RGB").save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+# --- STATIC HTML (built once per process; reruns only fill in the live values) ---
+_EMERGENCY_BANNER_TEMPLATE = (
+    '<div class="emergency-banner fade-in">'
+    '<h2>🚨 CRITICAL FLOOD WARNING 🚨</h2>'
+    '<p>Immediate action required. Risk Level: {risk}%</p>'
+    '</div>'
+)
+
+_EMERGENCY_CONTACTS_HTML = "".join(
+    f'<div class="emergency-card"><div class="contact-name">{service}</div>'
+    f'<div class="contact-number">{EMERGENCY_CONTACTS[key]}</div></div>'
+    for service, key in (
+        ("🚨 Disaster Prevention", 'disaster_prevention'),
+        ("🏥 Hatyai Municipality", 'hatyai_municipality'),
+        ("💧 Water Resources", 'water_resources'),
+        ("🚑 Hospital Emergency", 'hospital_emergency'),
+        ("🛡️ PSU Security", 'psu_security'),
+    )
+)
+
+# High priority evacuation zones + safe zones — one block each, so the <ul>
+# and its items land in the same element
+_EVACUATION_HTML = (
+    '<div style="background:#fee2e2;border:1px solid #fecaca;border-radius:8px;padding:15px;margin-bottom:15px;">'
+    '<h4 style="color:#dc2626;margin-top:0;">🔴 HIGH PRIORITY - Evacuate Immediately</h4>'
+    '<ul style="margin:10px 0;padding-left:20px;">'
+    + "".join(f"<li style='margin-bottom:5px;color:#7f1d1d;'>{zone}</li>" for zone in EVACUATION_ZONES['high_priority'])
+    + '</ul></div>'
+    '<div style="background:#dcfce7;border:1px solid #bbf7d0;border-radius:8px;padding:15px;">'
+    '<h4 style="color:#166534;margin-top:0;">🟢 SAFE ZONES</h4>'
+    '<ul style="margin:10px 0;padding-left:20px;">'
+    + "".join(f"<li style='margin-bottom:5px;color:#166534;'>{zone}</li>" for zone in EVACUATION_ZONES['safe_zones'])
+    + '</ul></div>'
+)
+
+# Sensor-health rows (local intel section)
+_HEALTH_ROW_TEMPLATE = (
+    '<div class="info-card" style="padding:10px 16px;margin-bottom:6px;display:flex;'
+    'justify-content:space-between;align-items:center;">'
+    '<span style="font-weight:600;color:#0f172a;font-size:0.9rem;">{icon} {station}</span>'
+    '<span class="health-badge {state}">{label}</span>'
+    '</div>'
+)
+_HEALTH_DETAIL_TEMPLATE = '<div class="health-detail">📋 {detail}</div>'
+
+# Sensor metadata table (provenance section) — STATION_METADATA is static, and
+# this script re-executes per rerun, so hold the frame in cache_resource
+@st.cache_resource
+def _station_meta_df():
+    return pd.DataFrame.from_records([
+        {
+            "Station": name,
+            "ID": meta.get('id'),
+            "Lat": meta.get('lat'),
+            "Lon": meta.get('lon'),
+            "Datum": "MSL",
+            "Ground (m)": meta.get('ground_level'),
+            "Bank (m)": meta.get('bank_full_capacity'),
+            "Warning (m)": meta.get('warning_threshold'),
+            "Critical (m)": meta.get('critical_threshold'),
+        }
+        for name, meta in STATION_METADATA.items()
+    ])
+
+# Header: labels and title come from the language pack, the rest is live
+_HEADER_TEMPLATE = (
+    '<div style="position:relative;text-align:center;margin-bottom:20px;padding-bottom:12px;border-bottom:4px solid #60a5fa;">'
+    '<div style="position:absolute;top:0;right:0;text-align:right;font-size:0.82rem;color:#64748b;line-height:1.7;">'
+    '<span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:#22c55e;margin-right:5px;animation:pulse-dot 2s ease-in-out infinite;"></span> <b style="color:#1a1a2e;">LIVE</b><br>'
+    '{last_update_label}: <b style="color:#1a1a2e;">{last_update}</b><br>'
+    '{source_label}: {source}'
+    '</div>'
+    '<div style="display:inline-flex;align-items:center;gap:30px;justify-content:center;">'
+    '{logo}'
+    '<div style="text-align:left;">'
+    # Title 2.5x larger (104px), Subtitle 2x larger (35px) via CSS classes
+    '<div class="hero-title-massive">{title}</div>'
+    '<div class="hero-subtitle-massive">{subtitle}</div>'
+    '</div></div></div>'
+)
+
+# =============================================================
+# 5. PAGE SECTIONS — each is an @st.fragment, so a widget inside one
+#    (e.g. the radar time slider) reruns only that section
+# =============================================================
+
+@st.fragment
+def _section_emergency(risk_report):
+    """Emergency contacts + evacuation zones (CRITICAL only)."""
     if risk_report['alert_level'] == 'CRITICAL':
         st.markdown("---")
         st.markdown("### 🆘 EMERGENCY RESPONSE ACTIVATED")
         
         # Emergency alert banner
-        _emerg_html = (
-            '<div class="fade-in" style="background:linear-gradient(135deg,#ef4444,#b91c1c);'
-            'color:white;padding:24px;border-radius:16px;margin-bottom:20px;text-align:center;'
-            'box-shadow:0 8px 32px rgba(239,68,68,0.25);">'
-            '<h2 style="margin:0;color:white;font-size:1.6rem;font-weight:800;letter-spacing:-0.3px;">🚨 CRITICAL FLOOD WARNING 🚨</h2>'
-            f'<p style="margin:10px 0 0 0;font-size:1rem;opacity:0.85;font-weight:500;">Immediate action required. Risk Level: {risk_report["primary_risk"]}%</p>'
-            '</div>'
+        st.markdown(
+            _EMERGENCY_BANNER_TEMPLATE.format(risk=risk_report["primary_risk"]),
+            unsafe_allow_html=True
         )
-        st.markdown(_emerg_html, unsafe_allow_html=True)
         
         # Emergency contacts and evacuation info
         col_emergency, col_evacuation = st.columns(2, gap="large")
         
         with col_emergency:
             st.markdown("#### 📞 Emergency Contacts")
-            
-            emergency_info = [
-                ("🚨 Disaster Prevention", EMERGENCY_CONTACTS['disaster_prevention']),
-                ("🏥 Hatyai Municipality", EMERGENCY_CONTACTS['hatyai_municipality']),
-                ("💧 Water Resources", EMERGENCY_CONTACTS['water_resources']),
-                ("🚑 Hospital Emergency", EMERGENCY_CONTACTS['hospital_emergency']),
-                ("🛡️ PSU Security", EMERGENCY_CONTACTS['psu_security'])
-            ]
-            
-            for service, number in emergency_info:
-                st.markdown(
-                    f"""
-                    <div class="emergency-card">
-                        <div style="font-weight:600;color:#0f172a;font-size:0.9rem;">{service}</div>
-                        <div style="font-size:1.2rem;color:#ef4444;font-weight:800;letter-spacing:-0.3px;">{number}</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
+            st.markdown(_EMERGENCY_CONTACTS_HTML, unsafe_allow_html=True)
         
         with col_evacuation:
             st.markdown("#### 🏃 Evacuation Zones")
-            
-            # High priority evacuation zones
-            st.markdown(
-                """
-                <div style="background:#fee2e2;border:1px solid #fecaca;border-radius:8px;padding:15px;margin-bottom:15px;">
-                    <h4 style="color:#dc2626;margin-top:0;">🔴 HIGH PRIORITY - Evacuate Immediately</h4>
-                    <ul style="margin:10px 0;padding-left:20px;">
-                """, 
-                unsafe_allow_html=True
-            )
-            
-            for zone in EVACUATION_ZONES['high_priority']:
-                st.markdown(f"<li style='margin-bottom:5px;color:#7f1d1d;'>{zone}</li>", unsafe_allow_html=True)
-            
-            st.markdown("</ul></div>", unsafe_allow_html=True)
-            
-            # Safe zones
-            st.markdown(
-                """
-                <div style="background:#dcfce7;border:1px solid #bbf7d0;border-radius:8px;padding:15px;">
-                    <h4 style="color:#166534;margin-top:0;">🟢 SAFE ZONES</h4>
-                    <ul style="margin:10px 0;padding-left:20px;">
-                """, 
-                unsafe_allow_html=True
-            )
-            
-            for zone in EVACUATION_ZONES['safe_zones']:
-                st.markdown(f"<li style='margin-bottom:5px;color:#166534;'>{zone}</li>", unsafe_allow_html=True)
-            
-            st.markdown("</ul></div>", unsafe_allow_html=True)
+            st.markdown(_EVACUATION_HTML, unsafe_allow_html=True)
         
         st.markdown("---")
 
-    # ==========================================================
-    # SECTION 1.5: CHECKLIST (Full Width)
-    # ==========================================================
+@st.fragment
+def _section_checklist(risk_report, t, lang_key):
+    """Risk-appropriate action checklist."""
     st.markdown('<div style="margin-top: 32px;"></div>', unsafe_allow_html=True)
     st.markdown(
         f'<div class="fade-in"><span class="section-header">📋 {t["checklist_title"]}</span></div>',
@@ -376,21 +613,22 @@ def main():
     # Localization logic for Checklist
     checklist_items = risk_report.get(f"action_checklist_{lang_key}", risk_report['action_checklist_en'])
     
-    # Display as neat cards
-    cols = st.columns(len(checklist_items))
-    for idx, item in enumerate(checklist_items):
-        with cols[idx % len(cols)]:
-            st.info(f"**{item}**")
+    # Display as neat cards — one CSS grid instead of one column + alert per item
+    st.markdown(
+        '<div class="checklist-grid">'
+        + "".join(f'<div class="checklist-item">{item}</div>' for item in checklist_items)
+        + '</div>',
+        unsafe_allow_html=True
+    )
 
-    # ==========================================================
-    # SECTION 2: STATION PIPELINE
-    # ==========================================================
-    eta = risk_report.get('eta', {})
+@st.fragment
+def _section_pipeline(sensor_data, eta, t, lang_key, roc):
+    """Upstream → downstream station pipeline."""
     render_pipeline(sensor_data, eta, t, lang_key, roc)
 
-    # ==========================================================
-    # SECTION 3: METRIC CARDS (Overview — no duplicate station data)
-    # ==========================================================
+@st.fragment
+def _section_metrics(risk_report, eta, roc, t, lang_key):
+    """Rain / rate-of-change / ETA overview cards."""
     st.markdown('<div style="margin-top: 24px;"></div>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
 
@@ -408,10 +646,10 @@ def main():
         roc_color = '#ef4444' if hy_roc > 0 else '#22c55e'
         _roc_sub = 'หาดใหญ่ (X.44)' if lang_key == 'th' else 'HatYai Station (X.44)'
         _roc_html = (
-            '<div class="info-card fade-in fade-in-delay-1">'
-            f'<div style="font-weight:600;font-size:0.72rem;color:#64748b;text-transform:uppercase;letter-spacing:0.08em;margin-bottom:6px;">{roc_label}</div>'
-            f'<div style="font-weight:800;font-size:1.8rem;color:{roc_color};line-height:1.3;letter-spacing:-0.5px;">{hy_roc:+.2f} <span style="font-size:0.85rem;color:#94a3b8;font-weight:500;">m/h</span></div>'
-            f'<div style="font-size:0.72rem;color:#94a3b8;font-weight:500;margin-top:4px;">{_roc_sub}</div>'
+            '<div class="info-card metric-card fade-in fade-in-delay-1">'
+            f'<div class="metric-label">{roc_label}</div>'
+            f'<div class="metric-value" style="color:{roc_color};">{hy_roc:+.2f} <small>m/h</small></div>'
+            f'<div class="metric-sub">{_roc_sub}</div>'
             '</div>'
         )
         # 1. Load Custom CSS
@@ -434,154 +672,86 @@ def main():
         
         _eta_sub = 'จาก อ.สะเดา → หาดใหญ่' if lang_key == 'th' else 'Sadao → HatYai'
         _eta_html = (
-            f'<div class="fade-in fade-in-delay-2" style="background:{eta_bg};border:1px solid {eta_border};border-radius:14px;padding:16px 20px;transition:all 0.25s cubic-bezier(.4,0,.2,1);">'
-            f'<div style="font-weight:600;font-size:0.72rem;color:#64748b;text-transform:uppercase;letter-spacing:0.08em;margin-bottom:6px;">{eta_title}</div>'
-            f'<div style="font-weight:800;font-size:1.8rem;color:#0f172a;line-height:1.3;letter-spacing:-0.5px;">{eta_val}</div>'
-            f'<div style="font-size:0.72rem;color:#94a3b8;font-weight:500;margin-top:4px;">{_eta_sub}</div>'
+            f'<div class="metric-card tinted fade-in fade-in-delay-2" style="background:{eta_bg};border:1px solid {eta_border};">'
+            f'<div class="metric-label">{eta_title}</div>'
+            f'<div class="metric-value">{eta_val}</div>'
+            f'<div class="metric-sub">{_eta_sub}</div>'
             '</div>'
         )
         st.markdown(_eta_html, unsafe_allow_html=True)
 
-    # ==========================================================
-    # SECTION 4: OUTLOOK & RAIN RADAR
-    # ==========================================================
-    st.markdown('<div style="margin-top: 32px;"></div>', unsafe_allow_html=True)
+@st.fragment
+def _section_outlook(outlook, t, lang_key):
+    """3-day rain outlook + daily bars."""
+    st.markdown(
+        f'<div class="fade-in"><span class="section-header">📅 {t["outlook_title"]}</span></div>',
+        unsafe_allow_html=True
+    )
     
-    col_out, col_map = st.columns(2)
+    # Localized Trend
+    trend_val = outlook.get(f'trend_{lang_key}', outlook.get('trend', 'N/A'))
+    st.markdown(f"**{t['trend']}:** {trend_val}")
     
-    outlook = risk_report.get('outlook', {})
-    with col_out:
-        st.markdown(
-            f'<div class="fade-in"><span class="section-header">📅 {t["outlook_title"]}</span></div>',
-            unsafe_allow_html=True
-        )
-        
-        # Localized Trend
-        trend_val = outlook.get(f'trend_{lang_key}', outlook.get('trend', 'N/A'))
-        st.markdown(f"**{t['trend']}:** {trend_val}")
-        
-        # Localized Peak Day
-        peak_day = outlook.get(f'max_rain_day_label_{lang_key}', '--')
-        peak_val = outlook.get('max_rain_val', 0)
-        st.markdown(f"**{t['peak_day']}:** {peak_day} ({peak_val} mm)")
-        
-        # Localized Summary
-        summ_txt = outlook.get(f'summary_{lang_key}', 'Waiting...')
-        st.info(f"💬 {summ_txt}")
-        
-        # Daily bars
-        dv = outlook.get('daily_vals', [])
-        dl = outlook.get(f'daily_labels_{lang_key}', [])
-        if dv and dl:
-            fig_daily = go.Figure(data=[
-                go.Bar(
-                    x=dl, y=dv,
-                    marker_color=['#3b82f6', '#2563EB', '#1d4ed8'],
-                    text=[f"{v:.1f}" for v in dv],
-                    textposition='auto',
-                    textfont=dict(color='white', size=13)
-                )
-            ])
-            fig_daily.update_layout(
-                height=160, margin=dict(l=0,r=0,t=5,b=20),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                xaxis=dict(showgrid=False),
-                yaxis=dict(showgrid=True, gridcolor='#e2e8f0', title="mm")
-            )
-            st.plotly_chart(fig_daily, use_container_width=True)
+    # Localized Peak Day
+    peak_day = outlook.get(f'max_rain_day_label_{lang_key}', '--')
+    peak_val = outlook.get('max_rain_val', 0)
+    st.markdown(f"**{t['peak_day']}:** {peak_day} ({peak_val} mm)")
     
-    with col_map:
-        st.markdown(
-            f'<div class="fade-in"><span class="section-header">📡 เรดาร์กลุ่มฝน (Rain Radar)</span></div>',
-            unsafe_allow_html=True
-        )
-        
-        @st.cache_data(ttl=600)
-        def fetch_rainviewer_data():
-            try:
-                resp = requests.get("https://api.rainviewer.com/public/weather-maps.json", timeout=5)
-                if resp.status_code == 200:
-                    return resp.json()
-            except Exception:
-                pass
-            return None
-        
-        rv_data = fetch_rainviewer_data()
-        
-        if rv_data and 'radar' in rv_data and 'past' in rv_data['radar']:
-            # Combine past and nowcast frames
-            frames = rv_data['radar'].get('past', []) + rv_data['radar'].get('nowcast', [])
-            if frames:
-                # Build dict for slider: formatted time string -> timestamp details
-                import pytz
-                bkk_tz = pytz.timezone('Asia/Bangkok')
-                
-                frame_options = {}
-                for f in frames:
-                    ts = f['time']
-                    dt = datetime.fromtimestamp(ts, tz=bkk_tz)
-                    label = dt.strftime("%H:%M")
-                    frame_options[label] = f
-                
-                labels = list(frame_options.keys())
-                
-                # Default to the 'now' frame or the last past frame
-                default_idx = len(rv_data['radar'].get('past', [])) - 1
-                if default_idx < 0: default_idx = len(labels) - 1
-                default_label = labels[default_idx] if labels else None
-                
-                selected_label = st.select_slider(
-                    "📅 เลือกเวลา (เวลาไทย):",
-                    options=labels,
-                    value=default_label
-                )
-                
-                selected_frame = frame_options[selected_label]
-                path = selected_frame['path'] # e.g. /v2/radar/1614777000
-                
-                # Create Folium Map
-                # Center on Songkhla (Lat: 7.0048, Lon: 100.4730)
-                m = folium.Map(location=[7.0048, 100.4730], zoom_start=9, max_zoom=18)
-                
-                # Add RainViewer TileLayer
-                tile_url = f"https://tilecache.rainviewer.com{path}/256/{{z}}/{{x}}/{{y}}/2/1_1.png"
-                folium.TileLayer(
-                    tiles=tile_url,
-                    attr="RainViewer",
-                    name="Rain Radar",
-                    overlay=True,
-                    control=True,
-                    opacity=0.7,
-                    max_native_zoom=13,
-                    maxNativeZoom=13,
-                    max_zoom=18,
-                    maxZoom=18
-                ).add_to(m)
-                
-                folium.LayerControl().add_to(m)
-                
-                # Render using streamlit_folium
-                st_folium(m, height=450, use_container_width=True, returned_objects=[])
-                
-                # Radar Color Legend
-                st.markdown("""
-                <div style="display: flex; justify-content: center; gap: 15px; font-size: 14px; margin-top: 10px;">
-                    <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #87CEFA; border-radius: 3px; display: inline-block;"></span> ฝนเล็กน้อย</div>
-                    <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #32CD32; border-radius: 3px; display: inline-block;"></span> ฝนปานกลาง</div>
-                    <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #FFD700; border-radius: 3px; display: inline-block;"></span> ฝนตกหนัก</div>
-                    <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #FF4500; border-radius: 3px; display: inline-block;"></span> ฝนรุนแรง</div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.warning("ไม่พบข้อมูลเรดาร์ (No radar frames available)")
-        else:
-            st.error("ไม่สามารถโหลดข้อมูล RainViewer ได้ (Failed to fetch radar data)")
+    # Localized Summary
+    summ_txt = outlook.get(f'summary_{lang_key}', 'Waiting...')
+    st.info(f"💬 {summ_txt}")
+    
+    # Daily bars
+    dv = outlook.get('daily_vals', [])
+    dl = outlook.get(f'daily_labels_{lang_key}', [])
+    if dv and dl:
+        st.plotly_chart(_daily_fig(tuple(dv), tuple(dl)), use_container_width=True)
 
-    # ==========================================================
-    # SECTION 5: CHARTS
-    # ==========================================================
+@st.fragment
+def _section_radar():
+    """RainViewer radar map with time slider."""
+    st.markdown(
+        f'<div class="fade-in"><span class="section-header">📡 เรดาร์กลุ่มฝน (Rain Radar)</span></div>',
+        unsafe_allow_html=True
+    )
+    
+    rv_data = _fetch_rainviewer()
     
+    if rv_data and 'radar' in rv_data and 'past' in rv_data['radar']:
+        frame_paths, default_label = _radar_frames(rv_data.get('generated'), rv_data)
+        if frame_paths:
+            selected_label = st.select_slider(
+                "📅 เลือกเวลา (เวลาไทย):",
+                options=list(frame_paths),
+                value=default_label
+            )
+            
+            path = frame_paths[selected_label] # e.g. /v2/radar/1614777000
+            
+            # One pre-composited PNG per frame: a slider move swaps an image
+            # instead of re-sending a whole Leaflet map
+            st.image(
+                _radar_png(path), width="stretch",
+                caption="Radar © RainViewer · Map © OpenStreetMap contributors, © CARTO"
+            )
+            
+            # Radar Color Legend
+            st.markdown("""
+            <div style="display: flex; justify-content: center; gap: 15px; font-size: 14px; margin-top: 10px;">
+                <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #87CEFA; border-radius: 3px; display: inline-block;"></span> ฝนเล็กน้อย</div>
+                <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #32CD32; border-radius: 3px; display: inline-block;"></span> ฝนปานกลาง</div>
+                <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #FFD700; border-radius: 3px; display: inline-block;"></span> ฝนตกหนัก</div>
+                <div style="display: flex; align-items: center; gap: 5px;"><span style="width: 15px; height: 15px; background-color: #FF4500; border-radius: 3px; display: inline-block;"></span> ฝนรุนแรง</div>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.warning("ไม่พบข้อมูลเรดาร์ (No radar frames available)")
+    else:
+        st.error("ไม่สามารถโหลดข้อมูล RainViewer ได้ (Failed to fetch radar data)")
+
+@st.fragment
+def _section_charts(rain_data, series, t):
+    """24h hourly rain + water level trend charts."""
     # 5A — RAIN INTENSITY (24h)
     hourly_rain = rain_data.get("hourly_rain", [])
     hourly_times = rain_data.get("hourly_times", [])
@@ -590,88 +760,27 @@ def main():
             f'<div class="fade-in"><span class="section-header">🌧️ {t["chart_rain_hourly"]}</span></div>',
             unsafe_allow_html=True
         )
-        colors = []
-        for v in hourly_rain:
-            if v > 30: colors.append("#ef4444")
-            elif v > 10: colors.append("#eab308")
-            elif v > 2: colors.append("#3b82f6")
-            else: colors.append("#93c5fd")
-        
-        fig_rain = go.Figure(go.Bar(
-            x=hourly_times, y=hourly_rain,
-            marker_color=colors,
-            text=[f"{v:.1f}" if v > 0.5 else "" for v in hourly_rain],
-            textposition='outside', textfont=dict(size=9, color='#64748b')
-        ))
-        
-        # Thresholds
-        fig_rain.add_hline(y=10, line_dash="dot", line_color="#cbd5e1")
-        
-        fig_rain.update_layout(
-            height=280, margin=dict(l=20,r=20,t=10,b=30),
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-            # Fixed Date format to prevent overlap (HH:MM)
-            xaxis=dict(showgrid=False, tickformat="%H:%M", tickangle=-45, dtick=10800000), # 3 hours
-            yaxis=dict(showgrid=True, gridcolor='#e2e8f0', title="mm/hr"),
-            showlegend=False
-        )
-        st.plotly_chart(fig_rain, use_container_width=True)
+        st.plotly_chart(_rain_fig(tuple(hourly_times), tuple(hourly_rain)), use_container_width=True)
 
     # 5B — WATER LEVEL TREND (24h)
-    if not latest_df.empty:
+    hatyai_df, sadao_df = series['HatYai'], series['Sadao']
+    if not (hatyai_df.empty and sadao_df.empty):
         st.markdown(
             f'<div class="fade-in"><span class="section-header">📈 {t["chart_water"]}</span></div>',
             unsafe_allow_html=True
         )
-        fig_water = go.Figure()
-        
-        plot_df = latest_df[latest_df['level'] > -5.0]
-        hatyai_plot = plot_df[plot_df['station_id'] == 'HatYai']
-        sadao_plot = plot_df[plot_df['station_id'] == 'Sadao']
-
-        # Danger zones
-        fig_water.add_hrect(y0=CRITICAL_LEVEL, y1=20, fillcolor="rgba(239,68,68,0.05)", line_width=0)
-        fig_water.add_hrect(y0=WARNING_LEVEL, y1=CRITICAL_LEVEL, fillcolor="rgba(234,179,8,0.05)", line_width=0)
-
-        # Force modes line+markers for visibility
-        fig_water.add_trace(go.Scatter(
-            x=hatyai_plot['timestamp'], y=hatyai_plot['level'],
-            name='Hat Yai', mode='lines+markers',
-            line=dict(color='#2563EB', width=3),
-            marker=dict(size=6),
-            fill='tozeroy', fillcolor='rgba(37,99,235,0.05)'
-        ))
-        fig_water.add_trace(go.Scatter(
-            x=sadao_plot['timestamp'], y=sadao_plot['level'],
-            name='Sadao', mode='lines+markers',
-            line=dict(color='#06b6d4', width=2, dash='dot'),
-            marker=dict(size=5)
-        ))
-        
-        # Forecast line removed as requested
-
-        # Threshold lines
-        fig_water.add_hline(y=WARNING_LEVEL, line_dash="solid", line_color="#eab308", line_width=1,
-                           annotation_text="Warning", annotation_font_color="#a16207")
-        fig_water.add_hline(y=CRITICAL_LEVEL, line_dash="solid", line_color="#ef4444", line_width=1,
-                           annotation_text="Critical", annotation_font_color="#dc2626")
-        
-        fig_water.update_layout(
-            height=350, margin=dict(l=0,r=0,t=10,b=0),
-            paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
-            hovermode="x unified",
-            xaxis=dict(showgrid=False, tickformat="%H:%M\n%d/%m"),
-            yaxis=dict(showgrid=True, gridcolor='#e2e8f0'),
-            legend=dict(orientation="h", y=1.08, font=dict(color='#1e293b'))
+        st.plotly_chart(
+            _water_fig(_downsample(hatyai_df), _downsample(sadao_df)),
+            use_container_width=True
         )
-        st.plotly_chart(fig_water, use_container_width=True)
 
-    # ==========================================================
-    # SECTION: HYBRID INTELLIGENCE (Local News + Sensor Health)
-    # ==========================================================
+@st.fragment
+def _section_local_intel(local_intel):
+    """hatyaicityclimate.org announcements + sensor health."""
     st.markdown("---")
+    is_th = st.session_state.lang == "TH"
     
-    section_title = "🌐 ข่าวสารและสถานะจากศูนย์หาดใหญ่" if st.session_state.lang == "TH" else "🌐 Local Intelligence (HatyaiCityClimate)"
+    section_title = "🌐 ข่าวสารและสถานะจากศูนย์หาดใหญ่" if is_th else "🌐 Local Intelligence (HatyaiCityClimate)"
     st.markdown(
         f'<div class="fade-in"><span class="section-header">{section_title}</span></div>',
         unsafe_allow_html=True
@@ -684,7 +793,7 @@ def main():
         col_news, col_health = st.columns([3, 2], gap="large")
         
         with col_news:
-            news_title = "📢 ประกาศล่าสุด" if st.session_state.lang == "TH" else "📢 Latest Announcements"
+            news_title = "📢 ประกาศล่าสุด" if is_th else "📢 Latest Announcements"
             st.markdown(f"#### {news_title}")
             
             news_items = local_intel.get('news', [])
@@ -707,63 +816,49 @@ def main():
                         unsafe_allow_html=True
                     )
             else:
-                no_news = "✅ ยังไม่มีประกาศเตือนภัยใหม่" if st.session_state.lang == "TH" else "✅ No new alerts"
+                no_news = "✅ ยังไม่มีประกาศเตือนภัยใหม่" if is_th else "✅ No new alerts"
                 st.success(no_news)
         
         with col_health:
-            health_title = "🛠️ สถานะเซนเซอร์" if st.session_state.lang == "TH" else "🛠️ Sensor Health"
+            health_title = "🛠️ สถานะเซนเซอร์" if is_th else "🛠️ Sensor Health"
             st.markdown(f"#### {health_title}")
             
+            # All stations in one block: a row per station, plus its outage detail
             station_health = local_intel.get('station_health', {})
+            outage_details = local_intel.get('outage_details', {})
+            online_label, outage_label = ("ปกติ", "ขัดข้อง") if is_th else ("Online", "Outage")
+            rows = []
             for station, status in station_health.items():
-                if status == "online":
-                    icon = "🟢"
-                    color = "#22c55e"
-                    label = "ปกติ" if st.session_state.lang == "TH" else "Online"
-                else:
-                    icon = "🔴"
-                    color = "#ef4444"
-                    label = "ขัดข้อง" if st.session_state.lang == "TH" else "Outage"
-                
-                detail = local_intel.get('outage_details', {}).get(station, '')
-                
-                health_bg = 'offline' if status != 'online' else 'online'
-                st.markdown(
-                    f"""
-                    <div class="info-card" style="
-                        padding:10px 16px;
-                        margin-bottom:6px;
-                        display:flex;
-                        justify-content:space-between;
-                        align-items:center;
-                    ">
-                        <span style="font-weight:600;color:#0f172a;font-size:0.9rem;">{icon} {station}</span>
-                        <span class="health-badge {health_bg}">{label}</span>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-                if detail and status != "online":
-                    st.caption(f"📋 {detail[:80]}")
+                online = status == "online"
+                rows.append(_HEALTH_ROW_TEMPLATE.format(
+                    icon="🟢" if online else "🔴", station=_html.escape(station),
+                    state='online' if online else 'offline',
+                    label=online_label if online else outage_label,
+                ))
+                detail = outage_details.get(station, '')
+                if detail and not online:
+                    rows.append(_HEALTH_DETAIL_TEMPLATE.format(detail=_html.escape(detail[:80])))
+            if rows:
+                st.markdown("".join(rows), unsafe_allow_html=True)
             
             # Camera count
             cam_count = len(local_intel.get('cameras', []))
             if cam_count > 0:
-                cam_label = f"📷 กล้อง CCTV ที่ตรวจพบ: **{cam_count} จุด**" if st.session_state.lang == "TH" else f"📷 CCTV cameras detected: **{cam_count} feeds**"
+                cam_label = f"📷 กล้อง CCTV ที่ตรวจพบ: **{cam_count} จุด**" if is_th else f"📷 CCTV cameras detected: **{cam_count} feeds**"
                 st.markdown(f"\n{cam_label}")
         
         # Source attribution
         st.caption(
             f"ℹ️ ข้อมูลจาก [hatyaicityclimate.org]({local_intel.get('source_url', 'https://www.hatyaicityclimate.org')}) "
             f"• ดึงเมื่อ {local_intel.get('scrape_time', datetime.now()).strftime('%H:%M')}"
-            if st.session_state.lang == "TH" else
+            if is_th else
             f"ℹ️ Source: [hatyaicityclimate.org]({local_intel.get('source_url', 'https://www.hatyaicityclimate.org')}) "
             f"• Fetched at {local_intel.get('scrape_time', datetime.now()).strftime('%H:%M')}"
         )
 
-    # ==========================================================
-    # DATA PROVENANCE & SENSOR METADATA (Transparency)
-    # ==========================================================
+@st.fragment
+def _section_provenance():
+    """Data provenance + sensor metadata expanders."""
     st.markdown("---")
     
     prov_col, meta_col = st.columns(2)
@@ -774,6 +869,12 @@ def main():
             if prov:
                 for src, info in prov.items():
                     status_icon = "🟢" if info.get('status') == 'ok' else ('🔵' if info.get('status') == 'cached' else '🔴')
+                    _extra = info.get('extra') or {}
+                    _enc = (
+                        f"\n- Encoding: `{_extra['content_encoding']}` "
+                        f"({_extra.get('wire_bytes') or '?'} → {_extra.get('decoded_bytes', '?')} bytes)"
+                        if 'content_encoding' in _extra else ""
+                    )
                     st.markdown(
                         f"**{status_icon} {src.upper()}**\n"
                         f"- Endpoint: `{info.get('endpoint', '?')}`\n"
@@ -781,32 +882,153 @@ def main():
                         f"- Fetched: `{info.get('fetched_utc', '?')}` UTC\n"
                         f"- Status: `{info.get('status', '?')}`\n"
                         f"- Fingerprint: `{info.get('fingerprint', '-')}`"
+                        f"{_enc}"
                     )
             else:
                 st.info("ยังไม่มีข้อมูล provenance — จะปรากฏหลังดึงข้อมูลครั้งแรก")
     
     with meta_col:
         with st.expander("🔧 ข้อมูลเซ็นเซอร์ (Sensor Metadata)", expanded=False):
-            meta_rows = []
-            for name, meta in STATION_METADATA.items():
-                meta_rows.append({
-                    "Station": name,
-                    "ID": meta.get('id'),
-                    "Lat": meta.get('lat'),
-                    "Lon": meta.get('lon'),
-                    "Datum": "MSL",
-                    "Ground (m)": meta.get('ground_level'),
-                    "Bank (m)": meta.get('bank_full_capacity'),
-                    "Warning (m)": meta.get('warning_threshold'),
-                    "Critical (m)": meta.get('critical_threshold'),
-                })
-            import pandas as _pd
-            st.dataframe(_pd.DataFrame(meta_rows), use_container_width=True, hide_index=True)
+            st.dataframe(_station_meta_df(), use_container_width=True, hide_index=True)
             st.caption(
                 "Datum: ทุกค่าอ้างอิง MSL (Mean Sea Level) จาก ThaiWater API\n\n"
                 "Bank = min_bank (ระดับตลิ่งต่ำสุด), Warning = bank − 1.5m"
             )
 
+# =============================================================
+# 6. MAIN APP
+# =============================================================
+def main():
+    if 'lang' not in st.session_state:
+        st.session_state.lang = "TH"
+    
+    lang = st.session_state.lang
+    lang_key = lang.lower()
+    is_th = lang == "TH"
+
+    # --- SIDEBAR ---
+    # T update handled by state change, main rerun picks it up at top
+    t = TRANSLATIONS[lang]
+    render_sidebar(t, predictor, on_reload=get_predictor.clear, cache_stats=CACHE_STATS)
+
+    # --- DATA FETCH ---
+    with st.spinner("กำลังโหลดข้อมูล..." if is_th else "Loading data..."):
+        sensor_data, rain_data, local_intel = _fetch_all()
+    
+    # --- HYBRID INTELLIGENCE: Zombie Data Detection ---
+    zombie_report = {}
+    
+    if local_intel.get('success') and local_intel.get('outage_stations'):
+        sensor_data, zombie_report = check_zombie_data(sensor_data, local_intel)
+    
+    # === FAILSAFE: Detect total data loss ===
+    _no_sensor = sensor_data.get('level') is None and not sensor_data.get('all_data')
+    _no_rain = rain_data.get('rain_sum_3d', 0) == 0 and not rain_data.get('raw_daily')
+    if _no_sensor and _no_rain:
+        st.error(
+            "🚫 **" + ("ไม่สามารถเชื่อมต่อแหล่งข้อมูลใดได้" if is_th
+            else "All data sources unavailable") + "**\n\n" +
+            ("ระบบไม่สามารถแสดงความเสี่ยงที่แม่นยำได้ กรุณาตรวจสอบประกาศจากเทศบาลนครหาดใหญ่โดยตรง"
+            if is_th
+            else "System cannot display accurate risk. Please check Hatyai Municipality announcements directly.")
+        )
+    
+    sensor_sig = _sensor_sig(sensor_data)
+    if _no_sensor:
+        # Virtual mode: no live reading, so trends from old DB rows would be stale
+        roc, preds = {}, []
+    else:
+        roc = _rate_of_change(sensor_sig)
+        preds = _predict(3, sensor_sig)
+    risk_report = _analyze(sensor_sig, _rain_sig(rain_data), sensor_data, rain_data, roc)
+    
+    station_series = _station_series(24, sensor_sig)
+    
+    # QA/QC flags
+    qa_result = compute_qa_flags(sensor_data, roc, sensor_data.get('timestamp'))
+    
+    # Timezone handling with proper Bangkok time
+    last_update = sensor_data.get("timestamp") or get_bangkok_time()
+    last_update_str = last_update.strftime('%d/%m/%Y %H:%M')
+
+    # === HEADER — Centered Title (matching user's mockup) ===
+    _logo = icon_b64('logo.png')
+    # Logo size 2.5x via CSS class
+    _header_html = _HEADER_TEMPLATE.format(
+        last_update_label=t["last_update"], last_update=last_update_str,
+        source_label=t["source"], source=risk_report['data_source'],
+        logo=f'<img src="{_logo}" class="hero-logo-massive">' if _logo else '',
+        title=t["title"], subtitle=t["subtitle"],
+    )
+    st.markdown(_header_html, unsafe_allow_html=True)
+
+    # === ABOUT MODAL MENU BUTTON ===
+    bt1, bt2, bt3 = st.columns([1, 2, 1])
+    with bt2:
+        btn_label = "ℹ️ เกี่ยวกับระบบนี้" if lang_key == 'th' else "ℹ️ About This System"
+        if st.button(btn_label, use_container_width=True):
+            show_about_dialog()
+
+
+    # === DISCLAIMER — right under title ===
+    _disc = t.get('disclaimer', '')
+    if _disc:
+        st.markdown(
+            f'<div class="hyfi-disclaimer">{_disc}</div>',
+            unsafe_allow_html=True
+        )
+
+    if sensor_data['is_fallback']:
+        st.warning(f"⚠️ Sensor data unavailable. Using **{risk_report['data_source']}** ({risk_report['confidence_score']}%)")
+    
+    # --- QA STATUS STRIP ---
+    render_qa_strip(qa_result, lang_key)
+    
+    # QA badges inline (compact)
+    render_inline_qa_badges(qa_result)
+
+    # --- ACTION BANNER (always visible, risk-appropriate) ---
+    risk_pct = risk_report.get('primary_risk', 0)
+
+    # --- ZOMBIE DATA WARNING ---
+    render_zombie_warning(zombie_report, lang_key)
+
+    # ==========================================================
+    # SECTION 1: HERO — Risk Gauge + ETA + Situation Report
+    # ==========================================================
+    render_hero(risk_report, lang_key, t)
+
+    # EMERGENCY RESPONSE SECTION (Critical Mode)
+    _section_emergency(risk_report)
+
+    # SECTION 1.5: CHECKLIST (Full Width)
+    _section_checklist(risk_report, t, lang_key)
+
+    # SECTION 2: STATION PIPELINE
+    eta = risk_report.get('eta', {})
+    _section_pipeline(sensor_data, eta, t, lang_key, roc)
+
+    # SECTION 3: METRIC CARDS (Overview — no duplicate station data)
+    _section_metrics(risk_report, eta, roc, t, lang_key)
+
+    # SECTION 4: OUTLOOK & RAIN RADAR
+    st.markdown('<div style="margin-top: 32px;"></div>', unsafe_allow_html=True)
+    
+    col_out, col_map = st.columns(2)
+    with col_out:
+        _section_outlook(risk_report.get('outlook', {}), t, lang_key)
+    with col_map:
+        _section_radar()
+
+    # SECTION 5: CHARTS
+    _section_charts(rain_data, station_series, t)
+
+    # SECTION: HYBRID INTELLIGENCE (Local News + Sensor Health)
+    _section_local_intel(local_intel)
+
+    # DATA PROVENANCE & SENSOR METADATA (Transparency)
+    _section_provenance()
+
     # ==========================================================
     # FOOTER
     # ==========================================================
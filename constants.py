@@ -3,8 +3,10 @@ HYFI Physical Constants and Hydrological Parameters
 Khlong U-Tapao Basin - Hat Yai Flood Monitoring System
 """
 
-import math
 from datetime import timedelta
+from typing import NamedTuple
+
+import numpy as np
 
 # =============================================================
 # GEOGRAPHICAL & PHYSICAL CONSTANTS
@@ -61,6 +63,40 @@ STATION_METADATA = {
     }
 }
 
+
+class Station(NamedTuple):
+    """Read-only, attribute-access view of one STATION_METADATA entry."""
+    id: int
+    code: str
+    name: str
+    location: str
+    bank_full: float
+    warning: float
+    critical: float
+    ground: float
+    min_valid: float
+    lat: float
+    lon: float
+
+
+# Built once at import, with the threshold fallbacks already resolved
+STATIONS = {
+    key: Station(
+        id=meta["id"],
+        code=meta["code"],
+        name=meta["name"],
+        location=meta["location"],
+        bank_full=meta["bank_full_capacity"],
+        warning=meta.get("warning_threshold", meta["bank_full_capacity"] - 1.5),
+        critical=meta.get("critical_threshold", meta["bank_full_capacity"]),
+        ground=meta.get("ground_level", 0.0),
+        min_valid=meta.get("min_valid_level", -5.0),
+        lat=meta["lat"],
+        lon=meta["lon"],
+    )
+    for key, meta in STATION_METADATA.items()
+}
+
 # River Hydraulic Parameters
 RIVER_HYDRAULICS = {
     # Khlong U-Tapao characteristics
@@ -192,42 +228,43 @@ SYSTEM_CONFIG = {
 }
 
 # Utility Functions
+# Defaults resolved once at import rather than looked up on every call
+_MAX_VELOCITY = RIVER_HYDRAULICS["max_velocity"]
+_RUNOFF_DELAY_HOURS = RIVER_HYDRAULICS["runoff_delay_hours"]
+_SIGMOID_K = RISK_CALCULATION["sigmoid_k"]
+_SIGMOID_X0 = RISK_CALCULATION["sigmoid_x0"]
+
 def calculate_actual_distance(straight_km: float, sinuosity: float) -> float:
     """Calculate actual river distance considering meandering."""
     return straight_km * sinuosity
 
-def calculate_flow_velocity(water_level: float, bank_full: float, base_velocity: float) -> float:
+def calculate_flow_velocity(water_level, bank_full: float, base_velocity: float):
     """
     Calculate flow velocity based on water level relative to bank full capacity.
     Uses Manning's equation simplified approach.
+    Returns a float for a scalar level, an ndarray for an array of levels.
     """
-    if water_level <= 0:
-        return base_velocity * 0.5
-    
-    # Hydraulic radius increases with water level
-    depth_ratio = min(water_level / bank_full, 1.5)
-    velocity_factor = math.sqrt(depth_ratio)
+    level = np.asarray(water_level, dtype=np.float64)
     
-    velocity = base_velocity * velocity_factor
-    return min(velocity, RIVER_HYDRAULICS["max_velocity"])
+    # Hydraulic radius increases with water level (dry bed: half base flow)
+    depth_ratio = np.minimum(np.maximum(level, 0.0) / bank_full, 1.5)
+    velocity = np.minimum(base_velocity * np.sqrt(depth_ratio), _MAX_VELOCITY)
+    velocity = np.where(level > 0, velocity, base_velocity * 0.5)
+    return float(velocity) if velocity.ndim == 0 else velocity
 
-def sigmoid_risk(water_level: float, k: float = None, x0: float = None) -> float:
+def sigmoid_risk(water_level, k: float = _SIGMOID_K, x0: float = _SIGMOID_X0):
     """
     Calculate risk using sigmoid function for smooth transitions.
-    Returns risk percentage (0-100).
+    Returns risk percentage (0-100): a float for a scalar level,
+    an ndarray for an array of levels (one vectorized pass).
     """
-    k = k or RISK_CALCULATION["sigmoid_k"]
-    x0 = x0 or RISK_CALCULATION["sigmoid_x0"]
-    
     # Normalize water level for sigmoid
-    normalized_level = (water_level - 5.0) / 10.0  # Normalize around 5-15m range
-    risk = 100 / (1 + math.exp(-k * (normalized_level - x0/10.0)))
-    return max(0, min(100, risk))
+    normalized_level = (np.asarray(water_level, dtype=np.float64) - 5.0) / 10.0  # Normalize around 5-15m range
+    risk = np.clip(100 / (1 + np.exp(-k * (normalized_level - x0 / 10.0))), 0, 100)
+    return float(risk) if risk.ndim == 0 else risk
 
-def calculate_eta_hours(distance_km: float, velocity_ms: float, lag_hours: int = None) -> float:
+def calculate_eta_hours(distance_km: float, velocity_ms: float, lag_hours: int = _RUNOFF_DELAY_HOURS) -> float:
     """Calculate estimated time of arrival in hours."""
-    lag_hours = lag_hours or RIVER_HYDRAULICS["runoff_delay_hours"]
-    
     # Convert distance to meters and calculate travel time
     distance_m = distance_km * 1000
     travel_time_hours = (distance_m / velocity_ms) / 3600
@@ -8,10 +8,24 @@ Scrapes hatyaicityclimate.org for:
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from utils import HTTP_SESSION
 
 # Base URL
 BASE_URL = "https://www.hatyaicityclimate.org"
 
+# BeautifulSoup backend: lxml's C parser (listed in requirements.txt); the
+# pure-Python one only as a fallback for environments that lack it
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Browser UA (the site rejects the session default); built once, not per scrape
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
 # Keywords that indicate sensor/station problems
 OUTAGE_KEYWORDS = [
     "ไฟฟ้าขัดข้อง", "ขัดข้อง", "ชำรุด", "ไม่ทำงาน",
@@ -59,10 +73,6 @@ def scrape_hatyai_climate():
         "error": str or None
     }
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     result = {
         "news": [],
         "station_health": {},
@@ -76,15 +86,30 @@ def scrape_hatyai_climate():
     }
     
     try:
-        response = requests.get(BASE_URL, headers=headers, timeout=10)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Shared keep-alive session; the browser UA overrides the session default
+        response = HTTP_SESSION.get(BASE_URL, headers=HEADERS, timeout=10)
+        response.raise_for_status()
+        # Raw bytes straight to the parser: one decode there, no str copy via .text
+        soup = BeautifulSoup(response.content, HTML_PARSER, from_encoding='utf-8')
         
         # =============================================
-        # A) NEWS & ALERTS
+        # A) NEWS & ALERTS + C) CAMERA FEEDS (one pass over links)
         # =============================================
         seen_titles = set()
+        seen_cams = set()
         for link in soup.find_all('a', href=True):
+            href = link['href']
+            
+            # C) Camera feed links
+            if '/flood/cam/' in href and '?name=' in href:
+                cam_name = href.split('?name=')[-1]
+                if cam_name not in seen_cams:
+                    seen_cams.add(cam_name)
+                    result["cameras"].append({
+                        "name": cam_name,
+                        "url": href if href.startswith('http') else f"{BASE_URL}{href}"
+                    })
+            
             text = link.get_text().strip()
             if len(text) < 15 or text in seen_titles:
                 continue
@@ -92,10 +117,10 @@ def scrape_hatyai_climate():
             # Check if this link contains alert/news keywords
             is_news = any(kw in text for kw in ALERT_KEYWORDS)
             # Also check for links to /paper/ pages (news articles)
-            is_paper = '/paper/' in link['href']
+            is_paper = '/paper/' in href
             
             if is_news or is_paper:
-                full_link = link['href']
+                full_link = href
                 if not full_link.startswith('http'):
                     full_link = f"{BASE_URL}{full_link}"
                 
@@ -132,28 +157,14 @@ def scrape_hatyai_climate():
                             result["outage_details"][sys_name] = line[:100]
                             break
         
-        # =============================================
-        # C) CAMERA FEED DETECTION
-        # =============================================
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if '/flood/cam/' in href and '?name=' in href:
-                cam_name = href.split('?name=')[-1]
-                full_url = href if href.startswith('http') else f"{BASE_URL}{href}"
-                
-                # Avoid duplicates
-                if not any(c['name'] == cam_name for c in result["cameras"]):
-                    result["cameras"].append({
-                        "name": cam_name,
-                        "url": full_url
-                    })
-        
         result["success"] = True
         
     except requests.Timeout:
         result["error"] = "Connection timed out (10s)"
     except requests.ConnectionError:
         result["error"] = "Cannot reach hatyaicityclimate.org"
+    except requests.HTTPError as e:
+        result["error"] = f"HTTP {e.response.status_code} from hatyaicityclimate.org"
     except Exception as e:
         result["error"] = f"Scraper error: {str(e)}"
     
@@ -163,7 +174,8 @@ def scrape_hatyai_climate():
 def check_zombie_data(api_sensor_data, scraper_result):
     """
     Cross-reference API data with scraper health check.
-    Returns a modified sensor_data dict with zombie values nullified.
+    Returns a modified sensor_data dict with zombie values nullified
+    (the input dict itself, uncopied, when there is nothing to nullify).
     
     Logic:
     - If scraper detected an outage for a station, set that station's
@@ -177,18 +189,22 @@ def check_zombie_data(api_sensor_data, scraper_result):
         dict: Modified sensor_data with zombie values replaced
         dict: Zombie report {station: reason}
     """
-    zombie_report = {}
-    modified_data = dict(api_sensor_data)  # Shallow copy
-    modified_data["all_data"] = dict(api_sensor_data.get("all_data", {}))
-    
     if not scraper_result.get("success"):
         # Scraper failed — can't validate, return original data with warning
-        return modified_data, {"_scraper": "Scraper offline, cannot validate"}
+        return api_sensor_data, {"_scraper": "Scraper offline, cannot validate"}
+    
+    outage_stations = scraper_result.get("outage_stations") or ()
+    if not outage_stations:
+        # Common case: nothing to nullify, so no copy either
+        return api_sensor_data, {}
     
-    outage_stations = scraper_result.get("outage_stations", [])
+    zombie_report = {}
+    modified_data = dict(api_sensor_data)  # Shallow copy
+    modified_data["all_data"] = dict(api_sensor_data.get("all_data", {}))
+    outage_details = scraper_result.get("outage_details", {})
     
     for station_name in outage_stations:
-        detail = scraper_result.get("outage_details", {}).get(station_name, "Unknown issue")
+        detail = outage_details.get(station_name, "Unknown issue")
         
         # Nullify the value in all_data
         if station_name in modified_data["all_data"]:
@@ -209,26 +225,41 @@ def check_zombie_data(api_sensor_data, scraper_result):
 
 
 if __name__ == "__main__":
+    import io
+    import sys
+    
+    # Script-only: Thai/emoji output on consoles with a legacy codepage.
+    # Kept out of module scope so importing the scraper never touches stdout.
+    if (sys.stdout.encoding or '').lower() != 'utf-8':
+        sys.stdout.reconfigure(encoding='utf-8')
+    
     print("--- Testing HatyaiCityClimate Scraper ---")
     data = scrape_hatyai_climate()
     
-    print(f"\nSuccess: {data['success']}")
-    print(f"Error: {data['error']}")
+    # Build the report in memory and emit it with a single write
+    buf = io.StringIO()
+    p = buf.write
     
-    print(f"\n📢 News ({len(data['news'])} items):")
+    p(f"\nSuccess: {data['success']}\n")
+    p(f"Error: {data['error']}\n")
+    
+    p(f"\n📢 News ({len(data['news'])} items):\n")
     for n in data['news'][:5]:
-        print(f"  • {n['title']}")
+        p(f"  • {n['title']}\n")
     
-    print(f"\n🛠️ Station Health:")
+    p(f"\n🛠️ Station Health:\n")
     for station, status in data['station_health'].items():
         icon = "🟢" if status == "online" else "🔴"
-        print(f"  {icon} {station}: {status}")
+        p(f"  {icon} {station}: {status}\n")
     
     if data['outage_stations']:
-        print(f"\n⚠️ Outage Detected: {data['outage_stations']}")
+        p(f"\n⚠️ Outage Detected: {data['outage_stations']}\n")
         for s, detail in data['outage_details'].items():
-            print(f"  {s}: {detail}")
+            p(f"  {s}: {detail}\n")
     
-    print(f"\n📷 Cameras ({len(data['cameras'])} feeds)")
+    p(f"\n📷 Cameras ({len(data['cameras'])} feeds)\n")
     for c in data['cameras'][:5]:
-        print(f"  • {c['name']}")
\ No newline at end of file
+        p(f"  • {c['name']}\n")
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
\ No newline at end of file
@@ -1,18 +1,48 @@
+import logging
 import sqlite3
 import pandas as pd
 import numpy as np
-import requests
 from datetime import datetime, timedelta
 from sklearn.linear_model import LinearRegression
 import functools
-import pytz
+from zoneinfo import ZoneInfo
 from constants import (
-    STATION_METADATA, RIVER_HYDRAULICS, RAINFALL_THRESHOLDS,
+    STATION_METADATA, STATIONS, RIVER_HYDRAULICS, RAINFALL_THRESHOLDS,
     HISTORICAL_EVENTS, RISK_CALCULATION, API_CONFIG,
     SYSTEM_CONFIG, calculate_flow_velocity, sigmoid_risk,
     calculate_eta_hours, calculate_actual_distance
 )
 from models.ingest import write_provenance, cleanup_raw
+from utils import HTTP_SESSION, load_json, transfer_stats
+
+logger = logging.getLogger(__name__)
+
+# =============================================================
+# STATION LOOKUPS (built once at import, not per call / per row)
+# =============================================================
+STATION_BY_ID = {info['id']: name for name, info in STATION_METADATA.items()}
+STATION_ID_STRS = [str(info['id']) for info in STATION_METADATA.values()]
+MIN_VALID_LEVEL = {name: st.min_valid for name, st in STATIONS.items()}
+
+# Historical events with the year folded in, ordered by year (static table)
+HISTORICAL_RECORDS = tuple({"year": year, **event} for year, event in sorted(HISTORICAL_EVENTS.items()))
+# Columnar 3-day rainfall of the same table, for the nearest-event lookup
+HISTORICAL_RAIN_3D = np.array([e['rain_mm_3d'] for e in HISTORICAL_RECORDS], dtype=float)
+BENCHMARK_2010_RAIN_3D = HISTORICAL_EVENTS[2010]['rain_mm_3d']
+
+# Resolved once; every timestamp helper below reuses it
+BANGKOK_TZ = ZoneInfo(SYSTEM_CONFIG['timezone'])
+
+# ThaiWater level fields, in order of preference
+_LEVEL_KEYS = ('waterlevel_msl', 'waterlevel', 'value')
+
+def _first_level(entry):
+    """First non-null level field of a ThaiWater entry (0.0 is a valid reading)."""
+    for key in _LEVEL_KEYS:
+        v = entry.get(key)
+        if v is not None:
+            return v
+    return None
 
 # =============================================================
 # UTILITY: Error Shielding Decorator
@@ -29,7 +59,7 @@ def safe_value(func):
                         val = float(result[key])
                         # Use station-specific validation
                         station_id = result.get('station_id', 'Unknown')
-                        min_threshold = STATION_METADATA.get(station_id, {}).get('min_valid_level', -5.0)
+                        min_threshold = MIN_VALID_LEVEL.get(station_id, -5.0)
                         if val <= min_threshold:
                             result[key] = None
                     except (ValueError, TypeError):
@@ -41,37 +71,64 @@ def clean_value(val, station_id=None):
     """Inline sanitizer for any sensor reading with station-specific logic."""
     if val is None:
         return None
-    try:
-        v = float(val)
-        # Use station-specific minimum threshold
-        min_threshold = STATION_METADATA.get(station_id, {}).get('min_valid_level', -5.0)
-        return v if v > min_threshold else None
-    except (ValueError, TypeError):
-        return None
+    if type(val) is float:
+        v = val  # already numeric (DB / parsed API rows) — skip the float() round-trip
+    else:
+        try:
+            v = float(val)
+        except (ValueError, TypeError):
+            return None
+    # Use station-specific minimum threshold
+    return v if v > MIN_VALID_LEVEL.get(station_id, -5.0) else None
+
+def clean_many(data, station_names):
+    """clean_value() for several stations of one reading dict -> {station: value|None}."""
+    return {name: clean_value(data.get(name), name) for name in station_names}
 
 def get_bangkok_time():
     """Get current time in Asia/Bangkok timezone."""
-    bangkok_tz = pytz.timezone(SYSTEM_CONFIG['timezone'])
-    return datetime.now(bangkok_tz)
+    return datetime.now(BANGKOK_TZ)
+
+def _parse_fixed_width(s):
+    """
+    Fast path for 'YYYY-MM-DD HH:MM[:SS]' / 'YYYY-MM-DDTHH:MM:SS'.
+    Digit offsets are fixed, so slice directly instead of running strptime.
+    Returns None when the string doesn't have that exact shape.
+    """
+    n = len(s)
+    if n not in (16, 19) or s[4] != '-' or s[7] != '-' or s[13] != ':':
+        return None
+    if s[10] != ' ' and not (s[10] == 'T' and n == 19):
+        return None
+    if n == 19 and s[16] != ':':
+        return None
+    try:
+        return datetime(
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[14:16]), int(s[17:19]) if n == 19 else 0
+        )
+    except ValueError:
+        return None
 
 def parse_timestamp(ts_str, assume_timezone=None):
     """Parse timestamp string with timezone awareness."""
     if not ts_str:
         return get_bangkok_time()
     
-    bangkok_tz = pytz.timezone(SYSTEM_CONFIG['timezone'])
+    tz = ZoneInfo(assume_timezone) if assume_timezone else BANGKOK_TZ
+    ts_str = ts_str.strip()
+    
+    dt = _parse_fixed_width(ts_str)
+    if dt is not None:
+        return dt.replace(tzinfo=tz)
     
     # Try different formats
     formats = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S']
     
     for fmt in formats:
         try:
-            dt = datetime.strptime(ts_str.strip(), fmt)
-            if assume_timezone:
-                dt = pytz.timezone(assume_timezone).localize(dt)
-            elif dt.tzinfo is None:
-                dt = bangkok_tz.localize(dt)
-            return dt
+            dt = datetime.strptime(ts_str, fmt)
+            return dt.replace(tzinfo=tz)
         except ValueError:
             continue
     
@@ -85,6 +142,12 @@ def parse_timestamp(ts_str, assume_timezone=None):
 SADAO_TO_HATYAI_KM = RIVER_HYDRAULICS['straight_distance_km']
 BASE_VELOCITY_MS = RIVER_HYDRAULICS['base_velocity_normal']
 
+# River path length is fixed by constants — compute once, not per ETA call
+ACTUAL_DISTANCE_KM = calculate_actual_distance(
+    RIVER_HYDRAULICS['straight_distance_km'],
+    RIVER_HYDRAULICS['sinuosity_factor']
+)
+
 
 class FloodPredictor:
     """
@@ -149,8 +212,7 @@ class FloodPredictor:
         api_config = API_CONFIG['thaiwater']
         cache_minutes = api_config['cache_minutes']
         
-        # Use station metadata from constants
-        station_mapping = {info['id']: name for name, info in STATION_METADATA.items()}
+        station_mapping = STATION_BY_ID
         primary_station_id = STATION_METADATA['HatYai']['id']
         
         result = {
@@ -204,37 +266,37 @@ class FloodPredictor:
                 write_provenance(
                     source="thaiwater",
                     endpoint=api_config['url'],
-                    station_ids=[str(m['id']) for m in STATION_METADATA.values()],
+                    station_ids=STATION_ID_STRS,
                     payload=None,
                     status="cached",
                     extra={"cache_timestamp": latest_ts_str}
                 )
-                print(f"[INFO] Using cached DB data from {latest_ts_str}")
+                logger.info("Using cached DB data from %s", latest_ts_str)
                 return result
                 
         except Exception as e:
-            print(f"[WARN] DB Cache check failed: {e}")
+            logger.warning("DB cache check failed: %s", e)
         finally:
             conn.close()
 
         # Fetch from API if no recent data
         try:
-            response = requests.get(
+            response = HTTP_SESSION.get(
                 api_config['url'], 
-                headers={'User-Agent': 'Mozilla/5.0'}, 
                 timeout=api_config['timeout']
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = load_json(response)
                 
                 # Record provenance (fresh API call)
                 write_provenance(
                     source="thaiwater",
                     endpoint=api_config['url'],
-                    station_ids=[str(m['id']) for m in STATION_METADATA.values()],
+                    station_ids=STATION_ID_STRS,
                     payload=data,
-                    status="ok"
+                    status="ok",
+                    extra=transfer_stats(response)
                 )
                 cleanup_raw("thaiwater", keep_last=48)
                 
@@ -254,25 +316,26 @@ class FloodPredictor:
                 if not isinstance(entries, list):
                     entries = []
                 
+                # Keep only our stations (the feed is nationwide) before any per-entry work
+                matched = [
+                    (entry, entry['station']) for entry in entries
+                    if isinstance(entry, dict)
+                    and isinstance(entry.get('station'), dict)
+                    and entry['station'].get('id') in station_mapping
+                ]
+                if not matched:
+                    logger.warning("ThaiWater payload has no entries for tracked stations")
+                    return result
+                
                 # Atomic database operation
                 conn = sqlite3.connect(self.db_path)
                 cursor = conn.cursor()
                 
                 try:
-                    for entry in entries:
-                        if not isinstance(entry, dict):
-                            continue
-                            
-                        st_info = entry.get('station', {})
-                        if not isinstance(st_info, dict):
-                            continue
-                        
-                        station_id = st_info.get('id')
-                        if station_id not in station_mapping:
-                            continue
-                        
+                    for entry, st_info in matched:
+                        station_id = st_info['id']
                         station_name = station_mapping[station_id]
-                        raw_val = entry.get('waterlevel_msl') or entry.get('waterlevel') or entry.get('value')
+                        raw_val = _first_level(entry)
                         val_float = clean_value(raw_val, station_name)
                         
                         # Capture dynamic bank data from API
@@ -308,7 +371,7 @@ class FloodPredictor:
                     conn.commit()
                     
                 except Exception as e:
-                    print(f"[ERROR] Database operation failed: {e}")
+                    logger.error("Database operation failed: %s", e)
                     conn.rollback()
                 finally:
                     conn.close()
@@ -317,25 +380,29 @@ class FloodPredictor:
                 write_provenance(
                     source="thaiwater",
                     endpoint=api_config['url'],
-                    station_ids=[str(m['id']) for m in STATION_METADATA.values()],
+                    station_ids=STATION_ID_STRS,
                     payload=None,
                     status=f"error_{response.status_code}"
                 )
-                print(f"[ERROR] API returned {response.status_code}")
+                logger.error("ThaiWater API returned %s", response.status_code)
                 
         except Exception as e:
-            print(f"[ERROR] Fetch Failed: {e}")
+            logger.error("ThaiWater fetch failed: %s", e)
             
         return result
 
-    def fetch_rain_forecast(self):
+    def fetch_rain_forecast(self, lat=None, lon=None):
         """
         Fetch rain forecast from Open-Meteo with proper timezone handling.
         Returns both daily (3-day) and hourly (24h) data.
+        Defaults to the Hat Yai station coordinates.
         """
         try:
             api_config = API_CONFIG['openmeteo']
-            hatyai_coords = STATION_METADATA['HatYai']
+            hatyai_coords = {
+                'lat': STATION_METADATA['HatYai']['lat'] if lat is None else lat,
+                'lon': STATION_METADATA['HatYai']['lon'] if lon is None else lon,
+            }
             
             params = {
                 "latitude": hatyai_coords['lat'],
@@ -346,14 +413,14 @@ class FloodPredictor:
                 "forecast_days": 3
             }
             
-            response = requests.get(
+            response = HTTP_SESSION.get(
                 api_config['url'], 
                 params=params, 
                 timeout=api_config['timeout']
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = load_json(response)
                 
                 # Record rain provenance
                 write_provenance(
@@ -361,7 +428,8 @@ class FloodPredictor:
                     endpoint=api_config['url'],
                     station_ids=f"{hatyai_coords['lat']},{hatyai_coords['lon']}",
                     payload=data,
-                    status="ok"
+                    status="ok",
+                    extra=transfer_stats(response)
                 )
                 cleanup_raw("openmeteo", keep_last=24)
                 daily = data.get("daily", {})
@@ -375,12 +443,11 @@ class FloodPredictor:
                 hourly_rain = hourly.get("precipitation", [])[:24]
                 
                 # Convert hourly times to Bangkok timezone
-                bangkok_tz = pytz.timezone(SYSTEM_CONFIG['timezone'])
                 formatted_times = []
                 for time_str in hourly_times:
                     try:
                         dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                        bangkok_dt = dt.astimezone(bangkok_tz)
+                        bangkok_dt = dt.astimezone(BANGKOK_TZ)
                         formatted_times.append(bangkok_dt)
                     except:
                         formatted_times.append(get_bangkok_time())
@@ -395,7 +462,7 @@ class FloodPredictor:
                 }
                 
         except Exception as e:
-            print(f"[ERROR] Open-Meteo Failed: {e}")
+            logger.error("Open-Meteo fetch failed: %s", e)
         
         return {
             "rain_sum_3d": 0.0, 
@@ -409,30 +476,33 @@ class FloodPredictor:
     # =========================================================
     # INTELLIGENCE ENGINE
     # =========================================================
-    def analyze_flood_risk(self, sensor_data, rain_data):
+    def analyze_flood_risk(self, sensor_data, rain_data, roc=None):
         """
         Advanced Risk Intelligence Engine v3:
         - Smooth Sigmoid-based Risk Assessment
         - Hydraulic-aware ETA calculation
         - Historical Comparison with 2010 benchmark
         - Physical reality-based logic
+        
+        Pass `roc` (from calculate_rate_of_change) when the caller already has it
+        to avoid a second DB read inside the ETA engine.
         """
         rain_sum = rain_data.get("rain_sum_3d", 0.0)
         current_level = sensor_data.get("level")
         station_name = sensor_data.get("station_name", "HatYai")
         
-        # Get station-specific thresholds
-        station_meta = STATION_METADATA.get(station_name, STATION_METADATA['HatYai'])
-        warning_threshold = station_meta.get('warning_threshold', station_meta['bank_full_capacity'] - 1.5)
-        critical_threshold = station_meta.get('critical_threshold', station_meta['bank_full_capacity'])
+        # Get station-specific thresholds (fallbacks resolved in STATIONS)
+        station = STATIONS.get(station_name, STATIONS['HatYai'])
+        warning_threshold = station.warning
+        critical_threshold = station.critical
         
         # 1. Calculate Rain Risk (0-100%)
         rain_risk_pc = min((rain_sum / RAINFALL_THRESHOLDS['catastrophic_24h']) * 100, 100)
         
         # 2. Calculate Water Level Risk (piecewise: low risk below warning, steep above)
         if current_level is not None:
-            ground = station_meta.get('ground_level', 0)
-            bank = station_meta['bank_full_capacity']
+            ground = station.ground
+            bank = station.bank_full
             
             if current_level <= ground:
                 water_risk_pc = 0.0
@@ -597,7 +667,7 @@ class FloodPredictor:
             }
 
         # 6. Advanced Time-to-Impact with Hydraulic Logic
-        eta = self.estimate_time_to_impact_hydraulic(sensor_data)
+        eta = self.estimate_time_to_impact_hydraulic(sensor_data, roc)
         
         # 7. Historical Comparison with Correct 2010 Benchmark
         history = self.get_historical_comparison_enhanced(rain_sum)
@@ -658,15 +728,15 @@ class FloodPredictor:
         # 3. Upstream Analysis
         all_d = sensor_data.get('all_data', {})
         sadao = all_d.get('Sadao')
-        sadao_meta = STATION_METADATA['Sadao']
-        sadao_warning = sadao_meta.get('warning_threshold', sadao_meta['bank_full_capacity'] - 1.5)
+        sadao_station = STATIONS['Sadao']
+        sadao_warning = sadao_station.warning
         
         if sadao is None:
             up_th = "ไม่สามารถอ่านค่าระดับน้ำต้นน้ำ (สะเดา) ได้"
             up_en = "Upstream sensor (Sadao) offline."
         elif sadao < sadao_warning:
             # Normal condition - use bank ratio for context
-            bank_ratio = (sadao / sadao_meta['bank_full_capacity']) * 100
+            bank_ratio = (sadao / sadao_station.bank_full) * 100
             up_th = f"ระดับน้ำสะเดาปกติ ({sadao:.2f} ม. MSL, {bank_ratio:.0f}% ของตลิ่ง)"
             up_en = f"Upstream normal at Sadao ({sadao:.2f}m MSL, {bank_ratio:.0f}% bank capacity)."
         else:
@@ -697,7 +767,7 @@ class FloodPredictor:
     # =========================================================
     # TIME-TO-IMPACT ENGINE
     # =========================================================
-    def estimate_time_to_impact_hydraulic(self, sensor_data):
+    def estimate_time_to_impact_hydraulic(self, sensor_data, roc=None):
         """
         Advanced ETA calculation using hydraulic principles:
         - River sinuosity factor for actual distance
@@ -717,14 +787,11 @@ class FloodPredictor:
                 "sadao_rising": False
             }
         
-        # Calculate actual river distance with sinuosity
-        actual_distance_km = calculate_actual_distance(
-            RIVER_HYDRAULICS['straight_distance_km'],
-            RIVER_HYDRAULICS['sinuosity_factor']
-        )
+        # Actual river distance with sinuosity (precomputed)
+        actual_distance_km = ACTUAL_DISTANCE_KM
         
         # Determine base velocity based on water level
-        sadao_bank_full = STATION_METADATA['Sadao']['bank_full_capacity']
+        sadao_bank_full = STATIONS['Sadao'].bank_full
         
         if sadao_level <= sadao_bank_full * 0.5:
             # Dry season - very low flow
@@ -744,7 +811,8 @@ class FloodPredictor:
         )
         
         # Get rate of change for dynamic adjustment
-        roc = self.calculate_rate_of_change()
+        if roc is None:
+            roc = self.calculate_rate_of_change()
         sadao_roc = roc.get("Sadao", 0.0)
         
         # Adjust velocity based on rate of change (momentum factor)
@@ -798,16 +866,12 @@ class FloodPredictor:
             }
         
         # Use correct 2010 benchmark
-        benchmark_2010 = HISTORICAL_EVENTS[2010]['rain_mm_3d']
+        benchmark_2010 = BENCHMARK_2010_RAIN_3D
         
-        # Find nearest historical event
-        nearest = None
-        min_diff = float('inf')
-        for year, event in HISTORICAL_EVENTS.items():
-            diff = abs(event['rain_mm_3d'] - current_rain_3d)
-            if diff < min_diff:
-                min_diff = diff
-                nearest = {"year": year, **event}
+        # Find nearest historical event (argmin keeps min()'s first-wins ties;
+        # copy: callers may annotate the result)
+        idx = int(np.argmin(np.abs(HISTORICAL_RAIN_3D - current_rain_3d)))
+        nearest = dict(HISTORICAL_RECORDS[idx])
         
         # Calculate percentage of 2010 catastrophe
         pct_of_2010 = round((current_rain_3d / benchmark_2010) * 100, 1)
@@ -851,7 +915,7 @@ class FloodPredictor:
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"[WARN] Failed to log risk: {e}")
+            logger.warning("Failed to log risk: %s", e)
 
     def get_latest_data(self, hours=24):
         """
@@ -868,26 +932,35 @@ class FloodPredictor:
         conn.close()
         
         if not df.empty:
-            # Convert timestamps with timezone awareness
-            df['timestamp'] = df['timestamp'].apply(lambda x: parse_timestamp(x))
+            # Stored as naive Bangkok-local strings: parse the column in one
+            # vectorized pass (cache=True reuses repeats shared across stations)
+            # into datetime64[ns, Asia/Bangkok]; unparseable rows become NaT
+            df['timestamp'] = pd.to_datetime(
+                df['timestamp'], format='ISO8601', errors='coerce', cache=True
+            ).dt.tz_localize(BANGKOK_TZ)
             df = df.dropna(subset=['timestamp'])
             
-            # Apply station-specific validation
-            valid_rows = []
-            for _, row in df.iterrows():
-                station_id = row['station_id']
-                level = row['level']
-                min_threshold = STATION_METADATA.get(station_id, {}).get('min_valid_level', -5.0)
-                if level > min_threshold:
-                    valid_rows.append(row)
-            
-            if valid_rows:
-                df = pd.DataFrame(valid_rows)
-            else:
-                df = pd.DataFrame(columns=['timestamp', 'station_id', 'level'])
+            # Apply station-specific validation (one vectorized compare)
+            min_threshold = df['station_id'].map(MIN_VALID_LEVEL).fillna(-5.0)
+            df = df[df['level'] > min_threshold]
         
         return df
 
+    def get_station_series(self, hours=24, stations=("HatYai", "Sadao")):
+        """
+        Validated (timestamp, level) frames split per station, ready to chart.
+        Missing stations map to an empty frame.
+        """
+        df = self.get_latest_data(hours=hours)
+        empty = pd.DataFrame(columns=['timestamp', 'level'])
+        if df.empty:
+            return {name: empty for name in stations}
+        groups = {
+            name: g.reset_index(drop=True)
+            for name, g in df.groupby('station_id', sort=False)[['timestamp', 'level']]
+        }
+        return {name: groups.get(name, empty) for name in stations}
+
     def calculate_rate_of_change(self):
         """
         Calculate rate of change for each station over the last 2 hours.
@@ -900,28 +973,24 @@ class FloodPredictor:
             return rates
             
         # Use Bangkok time for consistent calculations
-        bangkok_tz = pytz.timezone(SYSTEM_CONFIG['timezone'])
         now = get_bangkok_time()
         start_time_limit = now - timedelta(hours=1.5)
         
-        unique_stations = df['station_id'].unique()
+        # Every station in the window gets a rate; 0.0 unless it has 2+ recent readings
+        rates = dict.fromkeys(df['station_id'].unique(), 0.0)
         
-        for station in unique_stations:
-            station_df = df[df['station_id'] == station].sort_values('timestamp')
-            recent_df = station_df[station_df['timestamp'] >= start_time_limit]
-            
-            if len(recent_df) >= 2:
-                last_row = recent_df.iloc[-1]
-                first_row = recent_df.iloc[0]
-                level_diff = last_row['level'] - first_row['level']
-                time_diff_hours = (last_row['timestamp'] - first_row['timestamp']).total_seconds() / 3600
-                
-                if time_diff_hours > 0.1:
-                    rates[station] = level_diff / time_diff_hours
-                else:
-                    rates[station] = 0.0
-            else:
-                rates[station] = 0.0
+        # One groupby pass: first/last reading per station in the recent window
+        recent = df[df['timestamp'] >= start_time_limit].sort_values('timestamp', kind='stable')
+        ends = recent.groupby('station_id').agg(
+            n=('level', 'size'),
+            l0=('level', 'first'), l1=('level', 'last'),
+            t0=('timestamp', 'first'), t1=('timestamp', 'last'),
+        )
+        hours_span = (ends['t1'] - ends['t0']).dt.total_seconds().to_numpy() / 3600
+        level_diff = (ends['l1'] - ends['l0']).to_numpy()
+        valid = (ends['n'].to_numpy() >= 2) & (hours_span > 0.1)
+        slope = np.divide(level_diff, hours_span, out=np.zeros_like(level_diff, dtype=float), where=valid)
+        rates.update(zip(ends.index, slope.tolist()))
                 
         return rates
 
@@ -1002,28 +1071,27 @@ class FloodPredictor:
             
         # Prepare Sadao data
         df_sadao = df[df['station_id'] == 'Sadao'].set_index('timestamp')[['level']].resample('1h').mean().interpolate()
+        if df_sadao.empty:
+            return []
         
-        for h in range(1, hours + 1):
-            future_time = current_time + timedelta(hours=h)
-            target_sadao_time = future_time - timedelta(hours=lag)
-            
-            try:
-                # Find nearest Sadao data
-                if len(df_sadao) > 0:
-                    time_diffs = abs(df_sadao.index - target_sadao_time)
-                    nearest_idx = time_diffs.idxmin()
-                    sadao_val = df_sadao.loc[nearest_idx, 'level']
-                    
-                    # Make prediction
-                    pred_level = model.predict([[sadao_val]])[0]
-                    predictions.append({
-                        "time": future_time, 
-                        "level": pred_level,
-                        "confidence": "Medium" if lag <= 6 else "Low"
-                    })
-            except Exception as e:
-                print(f"[WARN] Prediction failed for hour {h}: {e}")
-                pass
+        # All horizons at once: nearest Sadao reading for each lagged target, one predict call
+        future_times = [current_time + timedelta(hours=h) for h in range(1, hours + 1)]
+        targets = pd.DatetimeIndex([ft - timedelta(hours=lag) for ft in future_times])
+        try:
+            nearest = df_sadao.index.get_indexer(targets, method='nearest')
+            sadao_vals = df_sadao['level'].to_numpy()[nearest]
+            pred_levels = model.predict(pd.DataFrame({'Sadao_Lagged': sadao_vals}))
+        except Exception as e:
+            logger.warning("Prediction failed: %s", e)
+            return []
+        
+        confidence = "Medium" if lag <= 6 else "Low"
+        for future_time, pred_level in zip(future_times, pred_levels):
+            predictions.append({
+                "time": future_time, 
+                "level": pred_level,
+                "confidence": confidence
+            })
                 
         return predictions
 
@@ -1035,18 +1103,25 @@ class FloodPredictor:
         headers = {'Authorization': f'Bearer {token}'}
         data = {'message': message}
         try:
-            requests.post(url, headers=headers, data=data)
+            HTTP_SESSION.post(url, headers=headers, data=data, timeout=10)
         except Exception as e:
-            print(f"[ERROR] Failed to send Line Notify: {e}")
+            logger.error("Failed to send Line Notify: %s", e)
 
 
 if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     print("Testing FloodPredictor v2...")
     predictor = FloodPredictor()
     print("Fetching data...")
-    data = predictor.fetch_and_store_data()
+    # ThaiWater and Open-Meteo are independent — overlap the two round-trips
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        sensor_future = ex.submit(predictor.fetch_and_store_data)
+        rain_future = ex.submit(predictor.fetch_rain_forecast)
+        data = sensor_future.result()
+        rain = rain_future.result()
     print("Sensor:", data.get("station_code"), data.get("level"))
-    rain = predictor.fetch_rain_forecast()
     print("Rain 3D:", rain.get("rain_sum_3d"), "Hourly pts:", len(rain.get("hourly_rain", [])))
     risk = predictor.analyze_flood_risk(data, rain)
     print("Risk:", risk.get("primary_risk"), "ETA:", risk.get("eta", {}).get("eta_label"))
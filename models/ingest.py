@@ -6,9 +6,9 @@ Immutable log — raw payloads saved to data/raw/{source}_{utc_ts}.json
 Latest provenance summary in data/last_fetch.json
 """
 
-import json
 import os
 import hashlib
+import orjson
 from datetime import datetime, timezone
 
 # ── Paths ──────────────────────────────────────────────────────
@@ -45,17 +45,19 @@ def write_provenance(
     ts_iso  = utc_now.strftime("%Y-%m-%dT%H:%M:%SZ")
     ts_file = utc_now.strftime("%Y%m%dT%H%M%SZ")
 
-    # ── Save raw payload (immutable) ──
+    # ── Save raw payload (immutable) + fingerprint (for dedup / integrity check) ──
+    # Serialized once: the archived bytes are exactly the fingerprinted bytes.
     raw_path = ""
-    if payload is not None:
-        raw_path = os.path.join(RAW_DIR, f"{source}_{ts_file}.json")
-        with open(raw_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, default=str, ensure_ascii=False, indent=2)
-
-    # ── Compute payload fingerprint (for dedup / integrity check) ──
     fingerprint = ""
     if payload is not None:
-        payload_bytes = json.dumps(payload, sort_keys=True, default=str).encode()
+        payload_bytes = orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        raw_path = os.path.join(RAW_DIR, f"{source}_{ts_file}.json")
+        with open(raw_path, "wb") as f:
+            f.write(payload_bytes)
         fingerprint = hashlib.sha256(payload_bytes).hexdigest()[:16]
 
     # ── Update provenance summary (last_fetch.json) ──
@@ -75,8 +77,8 @@ def write_provenance(
 
     prov[source] = record
 
-    with open(PROV_PATH, "w", encoding="utf-8") as f:
-        json.dump(prov, f, default=str, ensure_ascii=False, indent=2)
+    with open(PROV_PATH, "wb") as f:
+        f.write(orjson.dumps(prov, default=str, option=orjson.OPT_INDENT_2))
 
     return raw_path
 
@@ -91,9 +93,9 @@ def read_provenance() -> dict:
 def _read_provenance_file() -> dict:
     if os.path.exists(PROV_PATH):
         try:
-            with open(PROV_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(PROV_PATH, "rb") as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
             return {}
     return {}
 
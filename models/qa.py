@@ -6,14 +6,16 @@ offline sensors, datum consistency, and logical errors.
 Returns per-station QA flags + overall confidence score.
 """
 
+from zoneinfo import ZoneInfo
 from datetime import datetime, timezone, timedelta
-from constants import STATION_METADATA
+from constants import STATION_METADATA, SYSTEM_CONFIG
 
 
 # ── QA Flag Constants ──────────────────────────────────────────
 STALE_THRESHOLD_HOURS = 6       # Data older than this = stale
 MAX_JUMP_M_PER_HOUR = 2.0      # Max plausible rise/fall per hour
 MAX_DROP_M_PER_HOUR = 3.0      # Max plausible drop (faster than rise)
+BANGKOK_TZ = ZoneInfo(SYSTEM_CONFIG["timezone"])  # for naive timestamps
 
 
 def compute_qa_flags(
@@ -73,9 +75,7 @@ def compute_qa_flags(
         if last_update is not None:
             if last_update.tzinfo is None:
                 # Assume Bangkok timezone
-                import pytz
-                bkk = pytz.timezone("Asia/Bangkok")
-                last_update_aware = bkk.localize(last_update)
+                last_update_aware = last_update.replace(tzinfo=BANGKOK_TZ)
             else:
                 last_update_aware = last_update
             
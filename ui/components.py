@@ -1,9 +1,11 @@
 
+import threading
 import streamlit as st
 from constants import STATION_METADATA
-from utils import icon_b64
+from models.qa import qa_badge, qa_summary_text
+from utils import icon_b64, shared_cache_clear
 
-def render_sidebar(t, predictor):
+def render_sidebar(t, predictor, on_reload=None, cache_stats=None):
     """Render the sidebar with modern styling, language toggle and refresh button."""
     with st.sidebar:
         # Branding header with logo
@@ -32,17 +34,38 @@ def render_sidebar(t, predictor):
         
         st.divider()
         if st.button(t["refresh_btn"], use_container_width=True, type="primary"):
+            # Both layers: the in-process cache and the disk store behind it
             st.cache_data.clear()
+            shared_cache_clear()
+            st.rerun()
+        if on_reload and st.button(t["reload_model_btn"], use_container_width=True):
+            on_reload()
             st.rerun()
 
         with st.expander(f"⚙ {t['settings']}"):
             line_token = st.text_input(t["token_label"], type="password")
             if st.button(t["test_btn"]):
                 if line_token:
-                    predictor._send_line_notify(t["test_msg"], line_token)
+                    # Fire-and-forget: the POST must not hold up the rerun
+                    threading.Thread(
+                        target=predictor._send_line_notify,
+                        args=(t["test_msg"], line_token),
+                        daemon=True,
+                    ).start()
                     st.success(t["sent"])
                 else:
                     st.error(t["no_token"])
+            
+            if cache_stats and st.checkbox(t["cache_stats_toggle"]):
+                st.dataframe(
+                    [
+                        {"cache": name, "calls": s["calls"], "hits": s["calls"] - s["mem_misses"],
+                         "disk hits": s["mem_misses"] - s["misses"],
+                         "misses": s["misses"], "last ms": round(s["last_ms"], 1)}
+                        for name, s in cache_stats.items()
+                    ],
+                    hide_index=True, use_container_width=True
+                )
         
         st.markdown("---")
         st.markdown(f"#### {t['guide_title']}")
@@ -72,7 +95,6 @@ def render_qa_strip(qa_result, lang_key):
     """Render the QA warning strip as a modern pill if data quality is degraded."""
     qa_status = qa_result.get('overall_status', 'ok')
     if qa_status != 'ok':
-        from models.qa import qa_summary_text
         qa_msg = qa_summary_text(qa_result, lang_key)
         if qa_status == 'degraded':
             st.markdown(f'<div class="qa-pill" style="margin-bottom:8px;">⚠ {qa_msg}</div>', unsafe_allow_html=True)
@@ -105,8 +127,6 @@ def render_zombie_warning(zombie_report, lang_key):
 
 def render_inline_qa_badges(qa_result):
     """Render compact inline QA badges for each station."""
-    from models.qa import qa_badge
-    
     qa_stations = qa_result.get('stations', {})
     badge_parts = []
     
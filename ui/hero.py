@@ -2,6 +2,33 @@ import streamlit as st
 import plotly.graph_objects as go
 from utils import icon_b64
 
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _gauge_fig(risk_val, risk_color):
+    """Gauge depends only on (value, color) — build once per pair, shared read-only."""
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=risk_val,
+        number={'suffix': "%", 'font': {'size': 44, 'color': risk_color, 'family': 'Inter', 'weight': 700}},
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': '#e5e7eb', 'tickfont': {'size': 9, 'color': '#94a3b8'}},
+            'bar': {'color': risk_color, 'thickness': 0.2},
+            'bgcolor': '#f9fafb',
+            'borderwidth': 0,
+            'steps': [
+                {'range': [0, 30],  'color': '#f0fdf4'},
+                {'range': [30, 70], 'color': '#fefce8'},
+                {'range': [70, 100],'color': '#fef2f2'}
+            ],
+            'threshold': {'line': {'color': risk_color, 'width': 3}, 'thickness': 0.8, 'value': risk_val}
+        }
+    ))
+    fig_gauge.update_layout(
+        height=200, margin=dict(l=16, r=16, t=8, b=8),
+        paper_bgcolor='rgba(0,0,0,0)', font={'family': 'Inter'}
+    )
+    return fig_gauge
+
 def render_hero(risk_report, lang_key, t):
     """Hero Section matching user's mockup: Gauge left, Situation bullets right."""
     
@@ -52,29 +79,7 @@ def render_hero(risk_report, lang_key, t):
         )
         
         # Gauge chart
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=risk_val,
-            number={'suffix': "%", 'font': {'size': 44, 'color': risk_color, 'family': 'Inter', 'weight': 700}},
-            domain={'x': [0, 1], 'y': [0, 1]},
-            gauge={
-                'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': '#e5e7eb', 'tickfont': {'size': 9, 'color': '#94a3b8'}},
-                'bar': {'color': risk_color, 'thickness': 0.2},
-                'bgcolor': '#f9fafb',
-                'borderwidth': 0,
-                'steps': [
-                    {'range': [0, 30],  'color': '#f0fdf4'},
-                    {'range': [30, 70], 'color': '#fefce8'},
-                    {'range': [70, 100],'color': '#fef2f2'}
-                ],
-                'threshold': {'line': {'color': risk_color, 'width': 3}, 'thickness': 0.8, 'value': risk_val}
-            }
-        ))
-        fig_gauge.update_layout(
-            height=200, margin=dict(l=16, r=16, t=8, b=8),
-            paper_bgcolor='rgba(0,0,0,0)', font={'family': 'Inter'}
-        )
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        st.plotly_chart(_gauge_fig(risk_val, risk_color), use_container_width=True)
 
         # Status label under gauge
         if risk_val >= 70:
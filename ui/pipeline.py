@@ -1,10 +1,9 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import pytz
-from models.flood_predictor import clean_value, get_bangkok_time
+from models.flood_predictor import clean_many, get_bangkok_time, BANGKOK_TZ
 from constants import STATION_METADATA
-from utils import fmt, dot, CRITICAL_LEVEL, WARNING_LEVEL
+from utils import fmt, dot, level_class
 
 def get_station_info(station_name, msl_value, bank_info):
     """Convert MSL to depth + bank distance using official RID/ONWR thresholds."""
@@ -20,18 +19,19 @@ def get_station_info(station_name, msl_value, bank_info):
     return {'depth': None, 'left_to_bank': None, 'msl': None, 'overtopping': False}
 
 
-def _status_class(val, station_key):
-    """Return CSS class suffix based on sensor value."""
-    if val is None:
-        return "gray"
-    meta = STATION_METADATA.get(station_key, {})
-    crit = meta.get('critical_threshold', CRITICAL_LEVEL)
-    warn = meta.get('warning_threshold', WARNING_LEVEL)
-    if val > crit:
-        return "red"
-    if val > warn:
-        return "yellow"
-    return "green"
+# Flow divider between pipeline cards (static markup, built once)
+_ARROW_HTML = (
+    '<div class="flow-arrow" style="height:100%;min-height:120px;display:flex;align-items:center;justify-content:center;">'
+    '<span style="font-size:1.6rem;color:#cbd5e1;">→</span></div>'
+)
+
+# Indexed by level class (0 normal, 1 warning, 2 critical); -1 = no reading
+_STATUS_CLASSES = ("green", "yellow", "red", "gray")
+_VALUE_COLORS = ("#0f172a", "#eab308", "#ef4444", "#0f172a")
+
+def _level_index(val, station_key):
+    """Level class of a sensor value, or -1 when the sensor has no reading."""
+    return -1 if val is None else level_class(val, station_key)
 
 
 def _render_card(col, name, info, color_dot, station_key, t, last_update_ts=None, roc=None, delay_idx=0):
@@ -40,7 +40,10 @@ def _render_card(col, name, info, color_dot, station_key, t, last_update_ts=None
         depth = info['depth']
         ltb = info['left_to_bank']
         delta = roc.get(station_key, 0.0) if roc else 0.0
-        status = _status_class(val, station_key)
+        # Classified once; the card's CSS status and value color share the index
+        level_idx = _level_index(val, station_key)
+        status = _STATUS_CLASSES[level_idx]
+        val_color = _VALUE_COLORS[level_idx]
         
         # Bank text
         bank_color = '#64748b'
@@ -54,22 +57,11 @@ def _render_card(col, name, info, color_dot, station_key, t, last_update_ts=None
                 bank_text = f"อีก {ltb:.1f} ม. ถึงระดับตลิ่ง" if "น้ำ" in t['subtitle'] else f"{ltb:.1f}m to bank level"
                 bank_color = '#22c55e' if ltb > 3 else ('#eab308' if ltb > 1 else '#ef4444')
         
-        # Value color
-        val_color = "#0f172a"
-        if val is not None:
-            meta = STATION_METADATA.get(station_key, {})
-            crit = meta.get('critical_threshold', CRITICAL_LEVEL)
-            warn = meta.get('warning_threshold', WARNING_LEVEL)
-            if val > crit:
-                val_color = "#ef4444"
-            elif val > warn:
-                val_color = "#eab308"
-
         # Timestamp age
         age_text = ""
         if last_update_ts:
             if last_update_ts.tzinfo is None:
-                last_update_ts = pytz.timezone('Asia/Bangkok').localize(last_update_ts)
+                last_update_ts = last_update_ts.replace(tzinfo=BANGKOK_TZ)
             now = get_bangkok_time()
             diff = abs((now - last_update_ts).total_seconds() / 60)
             if diff < 2:
@@ -80,21 +72,21 @@ def _render_card(col, name, info, color_dot, station_key, t, last_update_ts=None
                 age_text = f"{int(diff/60)} ชม.ก่อน" if "น้ำ" in t['subtitle'] else f"{int(diff/60)}h ago"
         
         delta_color = '#ef4444' if delta > 0 else '#22c55e'
-        delta_html = f'<div style="font-size:0.82rem;color:{delta_color};font-weight:600;margin-top:2px;">{delta:+.2f} m/h</div>' if delta != 0 else ""
+        delta_html = f'<div class="card-delta" style="color:{delta_color};">{delta:+.2f} m/h</div>' if delta != 0 else ""
 
         depth_display = f'{depth:.1f}' if depth is not None else '—'
 
         _html = (
             f'<div class="station-card status-{status} fade-in fade-in-delay-{delay_idx}" style="margin-bottom:24px;">'
-            f'<div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:8px;">'
-            f'<div style="font-weight:700;font-size:0.92rem;color:#0f172a;letter-spacing:-0.2px;" title="{name}">{color_dot} {name}</div>'
-            f'<div style="font-size:0.65rem;color:#94a3b8;display:flex;align-items:center;gap:4px;">⏱ {age_text}</div>'
+            f'<div class="card-head">'
+            f'<div class="card-name" title="{name}">{color_dot} {name}</div>'
+            f'<div class="card-age">⏱ {age_text}</div>'
             f'</div>'
-            f'<div style="display:flex;justify-content:space-between;align-items:baseline;margin-bottom:2px;">'
-            f'<div><span style="font-size:2.4rem;font-weight:800;color:{val_color};line-height:1;">{depth_display}</span> <span style="font-size:0.85rem;color:#64748b;font-weight:500;">m</span></div>'
+            f'<div class="card-row">'
+            f'<div><span class="card-value" style="color:{val_color};">{depth_display}</span> <span class="card-unit">m</span></div>'
             f'{delta_html}'
             f'</div>'
-            f'<div style="font-size:0.75rem;color:{bank_color};font-weight:600;margin-top:6px;">{bank_text}</div>'
+            f'<div class="card-bank" style="color:{bank_color};">{bank_text}</div>'
             f'</div>'
         )
         st.markdown(_html, unsafe_allow_html=True)
@@ -117,9 +109,8 @@ def render_pipeline(sensor_data, eta, t, lang_key, roc=None):
     bank_info = sensor_data.get("bank_info", {})
     timestamp = sensor_data.get("timestamp")
     
-    sadao_v = clean_value(all_data.get("Sadao"))
-    hatyai_v = clean_value(all_data.get("HatYai"))
-    kalla_v = clean_value(all_data.get("Kallayanamit"))
+    vals = clean_many(all_data, ("Sadao", "HatYai", "Kallayanamit"))
+    sadao_v, hatyai_v, kalla_v = vals["Sadao"], vals["HatYai"], vals["Kallayanamit"]
     
     def get_info(name, val):
         return get_station_info(name, val, bank_info)
@@ -134,19 +125,11 @@ def render_pipeline(sensor_data, eta, t, lang_key, roc=None):
     _render_card(c1, t['sadao_unit'], sadao_info, dot(sadao_v, 'Sadao'), 'Sadao', t, timestamp, roc, delay_idx=1)
     
     with a1:
-        st.markdown(
-            '<div class="flow-arrow" style="height:100%;min-height:120px;display:flex;align-items:center;justify-content:center;">'
-            '<span style="font-size:1.6rem;color:#cbd5e1;">→</span></div>',
-            unsafe_allow_html=True
-        )
+        st.markdown(_ARROW_HTML, unsafe_allow_html=True)
     
     _render_card(c2, "Bang Sala (X.90)", kalla_info, dot(kalla_v, 'Kallayanamit'), 'Kallayanamit', t, timestamp, roc, delay_idx=2)
     
     with a2:
-        st.markdown(
-            '<div class="flow-arrow" style="height:100%;min-height:120px;display:flex;align-items:center;justify-content:center;">'
-            '<span style="font-size:1.6rem;color:#cbd5e1;">→</span></div>',
-            unsafe_allow_html=True
-        )
+        st.markdown(_ARROW_HTML, unsafe_allow_html=True)
     
     _render_card(c3, t['hatyai_unit'], hatyai_info, dot(hatyai_v, 'HatYai'), 'HatYai', t, timestamp, roc, delay_idx=3)
@@ -2,6 +2,19 @@
 HYFI Utility Functions
 """
 import base64, os
+import functools
+import hashlib
+import json
+import pickle
+import sqlite3
+import time
+from bisect import bisect_left
+import numpy as np
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from constants import STATION_METADATA
 
 # Default thresholds from HatYai
@@ -9,6 +22,100 @@ _HATYAI = STATION_METADATA.get('HatYai', {})
 CRITICAL_LEVEL = _HATYAI.get('critical_threshold', 8.88)
 WARNING_LEVEL = _HATYAI.get('warning_threshold', 7.38)
 
+# Shared HTTP session: keep-alive connection pool reused across API calls
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3, allowed_methods=["GET"]),
+))
+HTTP_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0',
+    'Connection': 'keep-alive',
+    # Only what urllib3 can decode here: gzip/deflate, plus br when brotli is installed
+    'Accept-Encoding': ACCEPT_ENCODING,
+})
+
+def transfer_stats(response):
+    """Compression actually negotiated for a response (for provenance records)."""
+    return {
+        "content_encoding": response.headers.get('Content-Encoding', 'identity'),
+        "wire_bytes": response.headers.get('Content-Length'),
+        "decoded_bytes": len(response.content),
+    }
+
+def load_json(response):
+    """Parse a JSON response body with orjson, falling back to stdlib for non-UTF-8 payloads."""
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return json.loads(response.text)
+
+# --- Shared fetch cache: disk-backed TTL store, survives restarts and is shared by workers ---
+_SHARED_CACHE_PATH = os.path.join(os.path.dirname(__file__), "data", "fetch_cache.db")
+
+def _shared_cache_conn():
+    os.makedirs(os.path.dirname(_SHARED_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(_SHARED_CACHE_PATH, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires REAL, value BLOB)")
+    return conn
+
+def shared_cached(ttl, should_store=None):
+    """
+    Cache fn's result on disk for `ttl` seconds, keyed by (function, args).
+    Best effort: any store error (locked, corrupt, unpicklable) just calls fn.
+    `should_store(value)` returning False keeps a result (e.g. a failed fetch)
+    out of the shared store, so one worker's outage doesn't reach the others.
+    Put st.cache_data in front of it for in-process hits.
+    """
+    def deco(fn):
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            now = time.time()
+            try:
+                key = hashlib.blake2b(
+                    pickle.dumps((name, args, sorted(kwargs.items()))), digest_size=16
+                ).hexdigest()
+                conn = _shared_cache_conn()
+                try:
+                    row = conn.execute("SELECT expires, value FROM cache WHERE key = ?", (key,)).fetchone()
+                finally:
+                    conn.close()
+                if row and row[0] > now:
+                    return pickle.loads(row[1])
+            except Exception:
+                key = None
+            value = fn(*args, **kwargs)
+            if key is not None and (should_store is None or should_store(value)):
+                try:
+                    conn = _shared_cache_conn()
+                    try:
+                        with conn:
+                            conn.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+                            conn.execute(
+                                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                                (key, now + ttl, pickle.dumps(value)),
+                            )
+                    finally:
+                        conn.close()
+                except Exception:
+                    pass
+            return value
+        return wrapper
+    return deco
+
+def shared_cache_clear():
+    """Drop every shared_cached entry (manual refresh). Best effort, like the cache itself."""
+    try:
+        conn = _shared_cache_conn()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache")
+        finally:
+            conn.close()
+    except Exception:
+        pass
+
 _ICON_DIR = os.path.join(os.path.dirname(__file__), "static", "icons")
 _ICON_CACHE = {}
 
@@ -23,6 +130,36 @@ def icon_b64(name):
             _ICON_CACHE[name] = ""
     return _ICON_CACHE[name]
 
+def lttb_indices(y, n_out, x=None):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the indices of the `n_out` points that best preserve the shape of y.
+    x defaults to the sample position (fine for regularly-polled telemetry).
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+    
+    # n_out - 2 interior buckets over [1, n-1); first and last points always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:nxt_end].mean()
+        avg_y = y[end:nxt_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
 def fmt(v):
     """Safe formatting for sensor values that may be None."""
     return f"{v:.2f}" if v is not None else "—"
@@ -30,18 +167,21 @@ def fmt(v):
 def _dot_html(color):
     return f'<span style="display:inline-block;width:10px;height:10px;border-radius:50%;background:{color};margin-right:4px;vertical-align:middle;"></span>'
 
+# Sorted (warning, critical) bounds per station for table-driven classification
+_DEFAULT_BOUNDS = (WARNING_LEVEL, CRITICAL_LEVEL)
+_LEVEL_BOUNDS = {
+    name: (meta.get('warning_threshold', WARNING_LEVEL), meta.get('critical_threshold', CRITICAL_LEVEL))
+    for name, meta in STATION_METADATA.items()
+}
+_DOTS = tuple(_dot_html(c) for c in ("#22c55e", "#eab308", "#ef4444"))
+_DOT_NONE = _dot_html("#cbd5e1")
+
+def level_class(v, station_name=None):
+    """Classify a level: 0 = normal, 1 = above warning, 2 = above critical."""
+    # bisect_left counts the bounds strictly below v
+    return bisect_left(_LEVEL_BOUNDS.get(station_name, _DEFAULT_BOUNDS), v)
+
 def dot(v, station_name=None):
     """Status indicator dot for a sensor value, station-aware."""
-    if v is None: return _dot_html("#cbd5e1")
-    
-    crit = CRITICAL_LEVEL
-    warn = WARNING_LEVEL
-    
-    if station_name and station_name in STATION_METADATA:
-        meta = STATION_METADATA[station_name]
-        crit = meta.get('critical_threshold', crit)
-        warn = meta.get('warning_threshold', warn)
-    
-    if v > crit: return _dot_html("#ef4444")
-    if v > warn: return _dot_html("#eab308")
-    return _dot_html("#22c55e")
+    if v is None: return _DOT_NONE
+    return _DOTS[level_class(v, station_name)]